@@ -0,0 +1,71 @@
+# Measures time taken by 'import resid' in fresh interpreters.
+# Also checks that heavy modules are not imported by 'import resid'.
+# --max-ms fails(exit code 1) when import is slower than limit.
+#
+# Usage: python benchmarks/bench_import.py --repeat 10 --max-ms 10
+
+import sys
+import argparse
+import subprocess
+
+
+# Modules that 'import resid' should not import(imported on first use).
+FORBIDDEN_MODULES = (
+    "socket",
+    "tempfile",
+    "glob",
+    "mimetypes",
+    "urllib.parse",
+    "concurrent.futures"
+)
+
+
+def time_import(module="resid"):
+    # Returns cumulative import time of module in microseconds.
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True
+    ).stderr
+    for line in output.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError("Import time of '{}' not found".format(module))
+
+def get_imported_modules(module="resid"):
+    # Returns names of modules loaded after importing module.
+    code = "import sys; before = set(sys.modules); import {}; " \
+        "print('\\n'.join(set(sys.modules) - before))".format(module)
+    output = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE,
+        universal_newlines=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures time taken by 'import resid'")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None,
+        help="fail if best import time exceeds milliseconds")
+    args = parser.parse_args()
+
+    times = [time_import() / 1000 for _ in range(args.repeat)]
+    print("import resid: best {:.2f}ms, worst {:.2f}ms".format(
+        min(times), max(times)))
+
+    failed = False
+    imported = get_imported_modules()
+    for name in FORBIDDEN_MODULES:
+        if name in imported:
+            print("'{}' is imported by 'import resid'".format(name))
+            failed = True
+    if args.max_ms is not None and min(times) > args.max_ms:
+        print("import resid is slower than {}ms".format(args.max_ms))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# Measures memory used to keep classification results.
+# Compares resource objects, to_dict() dicts and ResourceInfo records.
+# Memory is measured with tracemalloc and reported per million results.
+#
+# Usage: python benchmarks/bench_records.py --count 100000
+
+import gc
+import argparse
+import tracemalloc
+
+import resid
+
+
+def create_sources(count):
+    # Creates distinct sources(urls and file paths).
+    sources = []
+    for index in range(count):
+        if index % 2:
+            sources.append("https://example.com/files/{}.pdf".format(index))
+        else:
+            sources.append("data/folder{}/file{}.txt".format(index % 97, index))
+    return sources
+
+def measure(create_results, sources):
+    # Returns bytes allocated by results kept in memory.
+    # Results are first computed so that only kept objects are counted.
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = create_results(sources)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return after - before
+
+def keep_resources(sources):
+    resources = list(resid.classify_many(sources, cache_size=0))
+    # Properties are accessed as callers would(values are memoized).
+    for resource in resources:
+        resource.to_dict()
+    return resources
+
+def keep_dicts(sources):
+    return [resource.to_dict() for resource in \
+        resid.classify_many(sources, cache_size=0)]
+
+def keep_records(sources):
+    return list(resid.classify_many(sources, cache_size=0, records=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measures memory of classification results")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    sources = create_sources(args.count)
+    scale = 1000000 / args.count
+    print("{:<12}{:>14}{:>12}".format("results", "MB/million", "B/result"))
+    for name, function in [("resources", keep_resources),
+        ("dicts", keep_dicts), ("records", keep_records)]:
+        used = measure(function, sources)
+        print("{:<12}{:>14.1f}{:>12.0f}".format(
+            name, used * scale / 2**20, used / args.count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Compares serial and parallel recursive folder walks.
+# Synthetic deep tree is created in temporary folder.
+# --latency emulates slow file system(e.g network) by delaying reads.
+# Parallel walks are also checked to read only bounded number of folders
+# ahead of slow consumer(memory stays bounded), --check fails(exit code
+# 1) when more folders than max_pending were read ahead.
+#
+# Usage: python benchmarks/bench_walk.py --depth 6 --fanout 3 --latency 2
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+from resid import pathmod
+
+
+def create_tree(root, depth, fanout, files):
+    # Creates tree of folders with files in each folder.
+    # Returns number of entries(files and dirs) created.
+    count = 0
+    folders = [(root, 0)]
+    while folders:
+        folder, level = folders.pop()
+        for index in range(files):
+            open(os.path.join(folder, "file{}.txt".format(index)), "w").close()
+            count += 1
+        if level < depth:
+            for index in range(fanout):
+                sub_folder = os.path.join(folder, "dir{}".format(index))
+                os.mkdir(sub_folder)
+                folders.append((sub_folder, level + 1))
+                count += 1
+    return count
+
+def add_latency(seconds):
+    # Delays every os.scandir() call to emulate slow file system.
+    scandir = os.scandir
+    def slow_scandir(*args, **kwargs):
+        time.sleep(seconds)
+        return scandir(*args, **kwargs)
+    os.scandir = slow_scandir
+
+def time_walk(root, repeat, **kwargs):
+    # Returns best time and number of entries of recursive walk.
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in pathmod.scan(root, True, **kwargs))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+def measure_read_ahead(root, pause, **kwargs):
+    # Returns most folders read but not yet consumed during walk whose
+    # consumer pauses after each folder(slower than readers).
+    reads = [0]
+    scan_folder = pathmod._scan_folder
+    def counting_scan_folder(*args, **kwargs):
+        reads[0] += 1
+        return scan_folder(*args, **kwargs)
+    pathmod._scan_folder = counting_scan_folder
+    try:
+        consumed = set()
+        read_ahead = 0
+        for entry in pathmod.scan(root, True, **kwargs):
+            folder = os.path.dirname(entry.path)
+            if folder not in consumed:
+                consumed.add(folder)
+                time.sleep(pause)
+            read_ahead = max(read_ahead, reads[0] - len(consumed))
+        return read_ahead
+    finally:
+        pathmod._scan_folder = scan_folder
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares serial and parallel folder walks")
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fanout", type=int, default=3)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0,
+        help="milliseconds added to each folder read")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-pending", type=int, default=None,
+        help="folders read ahead of consumer(default 4 x workers)")
+    parser.add_argument("--pause", type=float, default=0.2,
+        help="milliseconds consumer takes per folder in read ahead check")
+    parser.add_argument("--check", action="store_true",
+        help="fail if parallel walks read more folders ahead than allowed")
+    args = parser.parse_args()
+    exceeded = False
+
+    with tempfile.TemporaryDirectory() as root:
+        created = create_tree(root, args.depth, args.fanout, args.files)
+        if args.latency:
+            add_latency(args.latency / 1000)
+        print("tree: {} entries, depth {}".format(created, args.depth))
+
+        serial_time, count = time_walk(root, args.repeat)
+        print("{:<26}{:>10.4f}s {:>10} entries".format(
+            "serial", serial_time, count))
+        for workers in args.workers:
+            for ordered in (True, False):
+                elapsed, count = time_walk(
+                    root, args.repeat, max_workers=workers, ordered=ordered,
+                    max_pending=args.max_pending
+                )
+                read_ahead = measure_read_ahead(
+                    root, args.pause / 1000, max_workers=workers,
+                    ordered=ordered, max_pending=args.max_pending
+                )
+                max_pending = args.max_pending or workers * 4
+                exceeded = exceeded or read_ahead > max_pending
+                name = "parallel({}, {})".format(
+                    workers, "ordered" if ordered else "as-completed")
+                print("{:<26}{:>10.4f}s {:>10} entries {:>6.2f}x "
+                    "{:>4} read ahead(max {})".format(
+                        name, elapsed, count, serial_time / elapsed,
+                        read_ahead, max_pending))
+    if args.check and exceeded:
+        print("parallel walk read more folders ahead than max_pending")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
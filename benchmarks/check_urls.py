@@ -0,0 +1,50 @@
+# Differential check of fast url parsing in urlmod on many strings.
+# Same comparison as tests/test_urlmod_differential.py(run by pytest)
+# but number of random strings and seed can be chosen.
+# Exits with code 1 if any result differs.
+#
+# Usage:
+#   python benchmarks/check_urls.py
+#   python benchmarks/check_urls.py --count 100000 --seed 3
+
+import os
+import sys
+import argparse
+
+from resid import urlmod
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests")
+)
+import test_urlmod_differential as differential
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compares fast url parsing with urllib.parse")
+    parser.add_argument("--count", type=int, default=20000,
+        help="number of random strings")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sources = differential.create_sources(args.count, args.seed)
+    differences = 0
+    for difference in differential.urlparse_differences(sources):
+        differences += 1
+        sys.stdout.write(difference + "\n")
+    pairs = (
+        (urlmod.is_url, differential.reference_is_url),
+        (urlmod.resembles_url, differential.reference_resembles_url)
+    )
+    for function, reference in pairs:
+        for difference in differential.function_differences(
+            function, reference, sources):
+            differences += 1
+            sys.stdout.write(difference + "\n")
+    sys.stdout.write("{} sources compared, {} difference(s)\n".format(
+        len(sources), differences))
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
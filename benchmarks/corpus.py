@@ -0,0 +1,203 @@
+# Generates sources used by benchmarks(see suite.py).
+# Sources are generated from seed so that runs are reproducible.
+# Nothing requires network access, hosts are never resolved.
+
+import io
+import os
+import random
+import pathlib
+
+from bench_walk import create_tree
+
+
+HOSTS = (
+    "example.com",
+    "www.example.org",
+    "cdn.static.example.net",
+    "api.example.io:8443",
+    "localhost",
+    "localhost:8000",
+    "127.0.0.1",
+    "192.168.1.20:8080",
+    "[::1]"
+)
+
+SCHEMES = ("https", "https", "https", "http", "http", "ftp")
+
+EXTENSIONS = (
+    ".html",
+    ".htm",
+    ".pdf",
+    ".txt",
+    ".json",
+    ".csv",
+    ".png",
+    ".jpg",
+    ".tar.gz",
+    ".py",
+    ""
+)
+
+WORDS = (
+    "docs",
+    "files",
+    "images",
+    "reports",
+    "2021",
+    "archive",
+    "user",
+    "static",
+    "index",
+    "data",
+    "readme",
+    "setup"
+)
+
+
+def _create_name(rng):
+    return "{}{}{}".format(
+        rng.choice(WORDS), rng.randint(0, 999), rng.choice(EXTENSIONS)
+    )
+
+def _create_url_path(rng):
+    parts = [rng.choice(WORDS) for _ in range(rng.randint(0, 4))]
+    return "/" + "/".join(parts + [_create_name(rng)])
+
+def create_urls(count, rng):
+    # Creates web urls with queries, fragments, ports and ip hosts.
+    urls = []
+    for _ in range(count):
+        url = "{}://{}{}".format(
+            rng.choice(SCHEMES), rng.choice(HOSTS), _create_url_path(rng)
+        )
+        if rng.random() < 0.3:
+            url += "?q={}&page={}".format(rng.choice(WORDS), rng.randint(1, 9))
+        if rng.random() < 0.1:
+            url += "#" + rng.choice(WORDS)
+        urls.append(url)
+    return urls
+
+def create_file_urls(count, rng, root):
+    # Creates 'file:' urls pointing inside root(may not exist).
+    root_url = pathlib.Path(root).absolute().as_uri()
+    return [root_url + _create_url_path(rng) for _ in range(count)]
+
+def create_non_urls(count, rng):
+    # Creates strings that resemble neither urls nor paths well.
+    sources = []
+    for _ in range(count):
+        sources.append(rng.choice((
+            "",
+            " ",
+            "just some words",
+            "mailto:user@example.com",
+            "://missing-scheme.com",
+            "http//broken.example.com",
+            "data:text/plain;base64,SGVsbG8=",
+            "a" * rng.randint(1, 300)
+        )))
+    return sources
+
+
+class Tree():
+    # Synthetic directory tree with existing files and folders.
+    def __init__(self, root, depth, fanout, files):
+        self.root = root
+        self.size = create_tree(root, depth, fanout, files)
+        self.files = []
+        self.dirs = []
+        for folder, dir_names, file_names in os.walk(root):
+            self.dirs.extend(os.path.join(folder, name) for name in dir_names)
+            self.files.extend(os.path.join(folder, name) for name in file_names)
+        self.files.sort()
+        self.dirs.sort()
+
+    def create_existing_paths(self, count, rng):
+        # Creates paths of existing files and folders.
+        paths = self.files + self.dirs
+        return [rng.choice(paths) for _ in range(count)]
+
+    def create_missing_paths(self, count, rng):
+        # Creates paths(absolute and relative) that dont exist.
+        paths = []
+        for _ in range(count):
+            folder = rng.choice(self.dirs or [self.root])
+            path = os.path.join(folder, "missing", _create_name(rng))
+            if rng.random() < 0.5:
+                path = os.path.relpath(path, self.root)
+            paths.append(path)
+        return paths
+
+
+def create_pathlib_paths(paths):
+    return [pathlib.Path(path) for path in paths]
+
+def create_bytes_paths(paths, rng):
+    # Encodes paths same as file system crawlers(see os.fsencode()).
+    # Some point to missing files whose names are not valid utf-8.
+    bytes_paths = []
+    for path in paths:
+        path = os.fsencode(path)
+        if rng.random() < 0.2:
+            name = b"caf\xe9" + os.fsencode(_create_name(rng))
+            path = os.path.join(path, name)
+        bytes_paths.append(path)
+    return bytes_paths
+
+def create_memory_files(count, rng):
+    # Creates in memory file objects(binary and text).
+    files = []
+    for index in range(count):
+        content = "".join(rng.choice(WORDS) for _ in range(rng.randint(1, 50)))
+        if index % 2:
+            files.append(io.BytesIO(content.encode()))
+        else:
+            files.append(io.StringIO(content))
+    return files
+
+def create_buffers(count, rng):
+    # Creates in memory buffers(bytearray and memoryview).
+    headers = (b"%PDF-1.7\n", b"\x89PNG\r\n\x1a\n", b"PK\x03\x04", b"<html>")
+    buffers = []
+    for index in range(count):
+        content = rng.choice(headers) + bytes(rng.randint(0, 4096))
+        if index % 2:
+            buffers.append(bytearray(content))
+        else:
+            buffers.append(memoryview(content))
+    return buffers
+
+
+class Corpus():
+    # Collection of generated sources grouped by kind.
+    # Kinds: url, file-url, non-url, path, missing-path, pathlib,
+    # bytes-path, memory-file and buffer.
+    def __init__(self, root, size=1000, seed=0, depth=4, fanout=4, files=8):
+        rng = random.Random(seed)
+        self.tree = Tree(root, depth, fanout, files)
+        existing_paths = self.tree.create_existing_paths(size, rng)
+        self.sources = {
+            "url": create_urls(size, rng),
+            "file-url": create_file_urls(size // 4, rng, root),
+            "non-url": create_non_urls(size // 4, rng),
+            "path": existing_paths,
+            "missing-path": self.tree.create_missing_paths(size, rng),
+            "pathlib": create_pathlib_paths(existing_paths[:size // 2]),
+            "bytes-path": create_bytes_paths(existing_paths[:size // 2], rng),
+            "memory-file": create_memory_files(size // 4, rng),
+            "buffer": create_buffers(size // 4, rng)
+        }
+        # All kinds shuffled together(same sources each run).
+        self.mixed = [
+            source for sources in self.sources.values() for source in sources
+        ]
+        rng.shuffle(self.mixed)
+
+    def get(self, kind):
+        # Returns sources of kind('mixed' for all kinds).
+        if kind == "mixed":
+            return self.mixed
+        return self.sources[kind]
+
+    def get_kinds(self):
+        return list(self.sources)
@@ -0,0 +1,364 @@
+# Benchmark suite covering high level functions and parts they use.
+# Runs offline on generated sources(see corpus.py) in temporary folder.
+# Results can be saved as JSON and compared against saved baseline.
+# --threshold fails(exit code 1) when case is slower than baseline by
+# more than given percent.
+#
+# Usage:
+#   python benchmarks/suite.py --json baseline.json
+#   python benchmarks/suite.py --compare baseline.json --threshold 15
+#   python benchmarks/suite.py --filter highlevel --quick
+
+import re
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+from urllib import parse
+
+import resid
+from resid import batch
+from resid import master
+from resid import urlmod
+from resid import pathmod
+from resid import sniff
+from resid import document
+from resid import highlevel
+
+import corpus
+import bench_import
+import bench_records
+
+
+# Changes when cases or generated sources change, results of different
+# versions may not be comparable.
+SUITE_VERSION = 5
+
+
+class Case():
+    # Benchmark case timing function called with each source.
+    # whole passes all sources to function in single call.
+    # loops fixes number of passes over sources per sample, otherwise
+    # passes are added until sample takes atleast min_time seconds.
+    unit = "ns/op"
+
+    def __init__(self, name, function, sources, setup=None, whole=False,
+        loops=None):
+        self.name = name
+        self.group = name.split(".")[0]
+        self.function = function
+        self.sources = sources
+        self.setup = setup
+        self.whole = whole
+        self.loops = loops
+
+    def _run(self, loops):
+        # Returns seconds taken by passes over sources.
+        function = self.function
+        sources = self.sources
+        if self.setup:
+            self.setup()
+        start = time.perf_counter()
+        for _ in range(loops):
+            if self.whole:
+                function(sources)
+            else:
+                for source in sources:
+                    function(source)
+        return time.perf_counter() - start
+
+    def _calibrate(self, min_time):
+        # Returns passes needed for sample to take atleast min_time.
+        # First pass also warms up caches and imports.
+        if self.loops:
+            self._run(self.loops)
+            return self.loops
+        elapsed = self._run(1)
+        if elapsed <= 0:
+            return 1000
+        return max(1, min(1000, int(min_time / elapsed) + 1))
+
+    def measure(self, repeat, min_time):
+        # Returns nanoseconds per source for each sample.
+        loops = self._calibrate(min_time)
+        ops = loops * len(self.sources)
+        return [self._run(loops) * 1e9 / ops for _ in range(repeat)]
+
+
+class MetricCase(Case):
+    # Benchmark case whose function measures value itself.
+    # e.g memory used by results or time of 'import resid'
+    def __init__(self, name, function, unit):
+        super().__init__(name, function, [None])
+        self.unit = unit
+
+    def measure(self, repeat, min_time):
+        return [self.function() for _ in range(repeat)]
+
+
+def clear_parse_caches():
+    # urllib.parse caches split urls too.
+    urlmod.clear_parse_cache()
+    parse.clear_cache()
+
+
+def create_cases(corpus_obj):
+    # Returns benchmark cases for sources of corpus.
+    cases = []
+    get = corpus_obj.get
+    root = corpus_obj.tree.root
+
+    for name in highlevel.__all__:
+        function = getattr(highlevel, name)
+        cases.append(Case(
+            "highlevel.{}[mixed]".format(name), function, get("mixed")
+        ))
+    for kind in corpus_obj.get_kinds():
+        cases.append(Case(
+            "highlevel.find_resource[{}]".format(kind),
+            highlevel.find_resource, get(kind)
+        ))
+
+    for kind in ("mixed", *corpus_obj.get_kinds()):
+        cases.append(Case(
+            "master.Master[{}]".format(kind), master.Master, get(kind)
+        ))
+    cases.append(Case(
+        "master.Master.get_resources[mixed]",
+        lambda source: master.Master(source).get_resources(), get("mixed")
+    ))
+    classifier = master.Classifier()
+    for function in (classifier.classify, classifier.find,
+        classifier.find_all):
+        cases.append(Case(
+            "master.Classifier.{}[mixed]".format(function.__name__),
+            function, get("mixed")
+        ))
+
+    urls = get("url") + get("file-url") + get("non-url")
+    for function in (urlmod.is_url, urlmod.resembles_url,
+        urlmod.is_locally_hosted, urlmod.extract_hostname):
+        cases.append(Case(
+            "urlmod.{}[urls]".format(function.__name__), function, urls
+        ))
+    cases.append(Case(
+        "urlmod.make_url_absolute[urls]",
+        lambda url: urlmod.make_url_absolute("https://example.com/a/", url),
+        get("url") + ["/index.html", "//cdn.example.net/a.js", "b/c.png"]
+    ))
+    for kind in ("url", "missing-path"):
+        cases.append(Case(
+            "urlmod.urlparse[cold, {}]".format(kind), urlmod.urlparse,
+            get(kind), setup=clear_parse_caches, loops=1
+        ))
+
+    paths = get("path") + get("missing-path")
+    for function in (pathmod.is_path, pathmod.is_file_path,
+        pathmod.is_dir_path, pathmod.resembles_path, pathmod.resembles_dir,
+        pathmod.resembles_file_path, pathmod.is_valid_path):
+        cases.append(Case(
+            "pathmod.{}[paths]".format(function.__name__), function, paths
+        ))
+    cases.append(Case(
+        "pathmod.is_path[pathlib]", pathmod.is_path, get("pathlib")
+    ))
+    cases.append(Case(
+        "pathmod.stat_many[paths]", pathmod.stat_many, paths, whole=True
+    ))
+
+    cases.append(Case(
+        "sniff.sniff_file[memory-file]", sniff.sniff_file, get("memory-file")
+    ))
+    cases.append(Case("sniff.sniff_path[paths]", sniff.sniff_path, paths))
+    cases.append(Case(
+        "sniff.sniff_paths[paths]", sniff.sniff_paths, paths, whole=True
+    ))
+
+    for recursive in (False, True):
+        suffix = "[recursive]" if recursive else ""
+        cases.append(Case(
+            "document.DirPath.get_files" + suffix,
+            lambda path, recursive=recursive: \
+                list(document.DirPath(path).get_files(recursive)),
+            [root]
+        ))
+        cases.append(Case(
+            "document.DirPath.get_dirs" + suffix,
+            lambda path, recursive=recursive: \
+                list(document.DirPath(path).get_dirs(recursive)),
+            [root]
+        ))
+    for workers in (None, pathmod.DEFAULT_SCAN_WORKERS):
+        cases.append(Case(
+            "pathmod.scan[recursive, workers={}]".format(workers),
+            lambda path, workers=workers: \
+                sum(1 for _ in pathmod.scan(path, True, max_workers=workers)),
+            [root]
+        ))
+
+    for records in (False, True):
+        cases.append(Case(
+            "batch.classify_many[mixed, records={}]".format(records),
+            lambda sources, records=records: \
+                list(batch.classify_many(sources, records=records)),
+            get("mixed"), whole=True
+        ))
+    cases.append(Case(
+        "batch.classify_columns[mixed]", batch.classify_columns,
+        get("mixed"), whole=True
+    ))
+    cases.append(MetricCase(
+        "batch.records.memory",
+        lambda: bench_records.measure(
+            bench_records.keep_records, get("mixed")
+        ) / len(get("mixed")),
+        "B/result"
+    ))
+
+    cases.append(MetricCase(
+        "import.resid", lambda: bench_import.time_import() / 1000, "ms"
+    ))
+    return cases
+
+
+def filter_cases(cases, patterns):
+    # Returns cases whose names match any of regex patterns.
+    if not patterns:
+        return cases
+    return [case for case in cases if \
+        any(re.search(pattern, case.name) for pattern in patterns)]
+
+def run_cases(cases, repeat, min_time, stream):
+    # Runs cases and returns results keyed by case name.
+    # Value of result is median of samples(lower is better).
+    results = {}
+    for case in cases:
+        samples = case.measure(repeat, min_time)
+        results[case.name] = {
+            "group": case.group,
+            "unit": case.unit,
+            "value": statistics.median(samples),
+            "best": min(samples),
+            "samples": samples,
+            "sources": len(case.sources)
+        }
+        stream.write("{:<52}{:>14.1f} {}\n".format(
+            case.name, results[case.name]["value"], case.unit))
+        stream.flush()
+    return results
+
+
+def create_report(results, args):
+    return {
+        "suite_version": SUITE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "resid": getattr(resid, "___version__", None),
+        "settings": {
+            "size": args.size,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "min_time": args.min_time
+        },
+        "results": results
+    }
+
+def compare_results(baseline, results, threshold, stream):
+    # Writes changes against baseline and returns names of regressions.
+    # Case regresses when its value grew more than threshold percent.
+    regressions = []
+    stream.write("{:<52}{:>12}{:>12}{:>10}\n".format(
+        "case", "baseline", "current", "change"))
+    for name, result in results.items():
+        if name not in baseline:
+            stream.write("{:<52}{:>12}{:>12.1f}{:>10}\n".format(
+                name, "-", result["value"], "new"))
+            continue
+        old = baseline[name]["value"]
+        change = (result["value"] - old) / old * 100 if old else 0
+        regressed = threshold is not None and change > threshold
+        if regressed:
+            regressions.append(name)
+        stream.write("{:<52}{:>12.1f}{:>12.1f} {:>+8.1f}%{}\n".format(
+            name, old, result["value"], change, " !" if regressed else ""))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Runs benchmarks of resid on generated sources")
+    parser.add_argument("-f", "--filter", nargs="+", default=[],
+        metavar="REGEX", help="only run cases whose names match")
+    parser.add_argument("--size", type=int, default=1000,
+        help="number of sources generated per kind")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5,
+        help="samples taken per case")
+    parser.add_argument("--min-time", type=float, default=0.05,
+        help="minimum seconds per sample")
+    parser.add_argument("--quick", action="store_true",
+        help="small sources and less samples(for smoke runs)")
+    parser.add_argument("--json", metavar="PATH",
+        help="write results as JSON to PATH('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH",
+        help="compare results with baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=None,
+        metavar="PERCENT", help="fail if case is slower than baseline "
+            "by more than PERCENT(requires --compare)")
+    parser.add_argument("--list", action="store_true",
+        help="list names of cases and exit")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.size = min(args.size, 100)
+        args.repeat = min(args.repeat, 3)
+        args.min_time = min(args.min_time, 0.01)
+    if args.threshold is not None and not args.compare:
+        parser.error("--threshold requires --compare")
+    # Table goes to stderr when JSON is written to stdout.
+    stream = sys.stderr if args.json == "-" else sys.stdout
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline_report = json.load(file)
+        baseline = baseline_report["results"]
+        if baseline_report.get("suite_version") != SUITE_VERSION:
+            stream.write("warning: baseline was created by different "
+                "version of suite\n")
+
+    # Addresses of local machine are retrieved once before timing.
+    urlmod.get_local_ip_addresses()
+    with tempfile.TemporaryDirectory() as root:
+        corpus_obj = corpus.Corpus(root, args.size, args.seed)
+        cases = filter_cases(create_cases(corpus_obj), args.filter)
+        if args.list:
+            stream.write("\n".join(case.name for case in cases) + "\n")
+            return 0
+        results = run_cases(cases, args.repeat, args.min_time, stream)
+
+    if args.json:
+        report = json.dumps(create_report(results, args), indent=2)
+        if args.json == "-":
+            sys.stdout.write(report + "\n")
+        else:
+            with open(args.json, "w") as file:
+                file.write(report + "\n")
+    if baseline is not None:
+        stream.write("\n")
+        regressions = compare_results(
+            baseline, results, args.threshold, stream
+        )
+        if regressions:
+            stream.write("{} case(s) regressed by more than {}%\n".format(
+                len(regressions), args.threshold))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,88 @@
-from .highlevel import *
+# Modules of resid are imported on first use to keep 'import resid' fast.
+# e.g 'resid.guess_content_type' imports highlevel module when accessed.
+
+import importlib
 
 
 ___version__ = "0.0.2"
+
+# Maps public functions accessible from resid package to modules
+# defining them, only module of accessed function is imported.
+# Names must match __all__ of those modules(see tests/test_package.py).
+_EXPORTS = {
+    **dict.fromkeys((
+        "find_resource",
+        "find_resources",
+        "find_resource_info",
+        "guess_content_type",
+        "guess_encoding",
+        "locally_hosted",
+        "remotely_hosted",
+        "is_supported",
+        "is_resembled",
+        "to_string",
+        "guess_type",
+        "guess_name",
+        "is_path",
+        "is_file_path",
+        "is_dir_path",
+        "is_path_like",
+        "is_file_path_url",
+        "is_url",
+        "is_web_url",
+        "is_file_like",
+        "is_buffer"
+    ), "highlevel"),
+    **dict.fromkeys((
+        "classify_many",
+        "classify_columns"
+    ), "batch"),
+    **dict.fromkeys((
+        "enable_instrumentation",
+        "disable_instrumentation",
+        "instrumentation_enabled",
+        "stats",
+        "reset_stats",
+        "add_stats_callback",
+        "remove_stats_callback"
+    ), "instrumentation")
+}
+
+__all__ = list(_EXPORTS)
+
+_SUBMODULES = (
+    "aio",
+    "batch",
+    "cli",
+    "codes",
+    "document",
+    "exceptions",
+    "file",
+    "file_memory",
+    "filepath",
+    "highlevel",
+    "instrumentation",
+    "master",
+    "pathmod",
+    "resource",
+    "sniff",
+    "urlmod",
+    "webpage",
+    "weburl"
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    elif name in _EXPORTS:
+        module = importlib.import_module("." + _EXPORTS[name], __name__)
+        value = getattr(module, name)
+        # Next access wont need __getattr__()
+        globals()[name] = value
+        return value
+    err_msg = "module '{}' has no attribute '{}'"
+    raise AttributeError(err_msg.format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_EXPORTS))
@@ -0,0 +1,8 @@
+# Allows running resid as module e.g python -m resid < sources.txt
+
+import sys
+
+from .cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,171 @@
+# Asynchronous versions of high level functions(see highlevel module).
+# Blocking work(e.g os.stat(), resolving ip addresses) is done in
+# bounded executor so that event loop is not blocked.
+# Sources needing only computation(e.g urls, buffers) are handled inline.
+
+import io
+import asyncio
+import functools
+
+from . import document
+from . import highlevel
+from . import pathmod
+
+
+__all__ = [
+    *highlevel.__all__,
+    "classify_many",
+    "gather_sources",
+    "get_executor",
+    "set_executor"
+]
+
+# Max threads of default executor for blocking work.
+DEFAULT_MAX_WORKERS = 16
+
+# Max sources processed at once by gather_sources().
+DEFAULT_CONCURRENCY = 64
+
+# Names of high level functions that never block(url parsing is
+# enough). Names are used as functions may be wrapped(see
+# instrumentation module).
+_NON_BLOCKING_FUNCTIONS = {
+    "is_url",
+    "is_web_url",
+    "is_file_path_url",
+    "is_file_like",
+    "is_buffer"
+}
+
+# File objects read without blocking when sniffed(contents in memory).
+_IN_MEMORY_FILE_TYPES = (io.BytesIO, io.StringIO)
+
+_executor = None
+
+
+def get_executor():
+    # Returns executor for blocking work(created on first use).
+    global _executor
+    if _executor is None:
+        from concurrent import futures
+        _executor = futures.ThreadPoolExecutor(
+            DEFAULT_MAX_WORKERS, thread_name_prefix="resid"
+        )
+    return _executor
+
+def set_executor(executor):
+    # Sets executor to be used for blocking work.
+    global _executor
+    _executor = executor
+
+
+def _source_may_block(source):
+    # Checks if classifying source may access file system or network.
+    # Strings and paths are checked against file system, file objects
+    # are read when sniffed(e.g real files, pipes).
+    if isinstance(source, pathmod.PATH_TYPES):
+        return True
+    elif isinstance(source, _IN_MEMORY_FILE_TYPES):
+        return False
+    return bool(document.FileMemory.sniff_size) and hasattr(source, "read")
+
+async def _call(function, source, *args, **kwargs):
+    # Calls high level function with source.
+    # Call is done in executor if it may block event loop.
+    if function.__name__ in _NON_BLOCKING_FUNCTIONS or \
+        not _source_may_block(source):
+        return function(source, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    call = functools.partial(function, source, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+async def find_resources(source, strict=False, **kwargs):
+    return await _call(highlevel.find_resources, source, strict, **kwargs)
+
+async def find_resource(source, strict=False, **kwargs):
+    return await _call(highlevel.find_resource, source, strict, **kwargs)
+
+async def find_resource_info(source, strict=False, **kwargs):
+    return await _call(
+        highlevel.find_resource_info, source, strict, **kwargs
+    )
+
+async def guess_content_type(source):
+    return await _call(highlevel.guess_content_type, source)
+
+async def guess_encoding(source):
+    return await _call(highlevel.guess_encoding, source)
+
+async def locally_hosted(source):
+    return await _call(highlevel.locally_hosted, source)
+
+async def remotely_hosted(source):
+    return await _call(highlevel.remotely_hosted, source)
+
+async def is_supported(source):
+    return await _call(highlevel.is_supported, source)
+
+async def is_resembled(source):
+    return await _call(highlevel.is_resembled, source)
+
+async def to_string(source):
+    return await _call(highlevel.to_string, source)
+
+async def guess_type(source):
+    return await _call(highlevel.guess_type, source)
+
+async def guess_name(source):
+    return await _call(highlevel.guess_name, source)
+
+
+async def is_path(source, strict=False):
+    return await _call(highlevel.is_path, source, strict)
+
+async def is_file_path(source, strict=False):
+    return await _call(highlevel.is_file_path, source, strict)
+
+async def is_dir_path(source, strict=False):
+    return await _call(highlevel.is_dir_path, source, strict)
+
+async def is_path_like(source, strict=False):
+    return await _call(highlevel.is_path_like, source, strict)
+
+async def is_file_path_url(source, strict=False):
+    return await _call(highlevel.is_file_path_url, source, strict)
+
+async def is_url(source, strict=False):
+    return await _call(highlevel.is_url, source, strict)
+
+async def is_web_url(source, strict=False):
+    return await _call(highlevel.is_web_url, source, strict)
+
+async def is_file_like(source, strict=False):
+    return await _call(highlevel.is_file_like, source, strict)
+
+async def is_buffer(source, strict=False):
+    return await _call(highlevel.is_buffer, source, strict)
+
+
+async def gather_sources(coroutine_function, sources, *args,
+    concurrency=DEFAULT_CONCURRENCY, **kwargs):
+    # Calls coroutine function for each source and gathers results.
+    # Results are in same order as sources.
+    # concurrency limits number of sources being processed at once.
+    semaphore = asyncio.Semaphore(concurrency)
+    async def call(source):
+        async with semaphore:
+            return await coroutine_function(source, *args, **kwargs)
+    return await asyncio.gather(*map(call, sources))
+
+async def classify_many(sources, strict=False,
+    concurrency=DEFAULT_CONCURRENCY, **kwargs):
+    # Finds resource for each source(see find_resource()).
+    return await gather_sources(
+        find_resource, sources, strict, concurrency=concurrency, **kwargs
+    )
+
+
+if __name__ == "__main__":
+    sources = ["aio.py", "https://example.com/", object()]
+    print(asyncio.run(classify_many(sources)))
@@ -0,0 +1,287 @@
+# Classifies many sources in one go.
+# Results are yielded as stream in same order as sources.
+# Identical sources share their results through bounded cache.
+
+import array
+import pathlib
+import itertools
+import collections
+
+from . import codes
+from . import highlevel
+
+
+__all__ = [
+    "classify_many",
+    "classify_columns"
+]
+
+# Max number of distinct sources whose results are remembered.
+# Least recently used results are dropped when cache is full.
+DEFAULT_CACHE_SIZE = 4096
+
+# Number of sources sent to worker process at once.
+DEFAULT_CHUNK_SIZE = 2048
+
+
+class ResultsCache():
+    # Bounded cache for results of classified sources.
+    # Sources that cannot be hashed(e.g lists) are never cached.
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self._max_size = max_size
+        self._results = collections.OrderedDict()
+
+    @staticmethod
+    def _create_key(source):
+        # Type is part of key so that equal sources of different types
+        # dont share results e.g 1 and True.
+        if isinstance(source, memoryview):
+            # Hashing memoryview reads whole buffer, so its not cached.
+            raise TypeError("memoryview sources are not cached")
+        return (type(source), source)
+
+    def get(self, source, default=None):
+        # Returns cached result for source or default if not cached.
+        try:
+            key = self._create_key(source)
+            result = self._results[key]
+        except (KeyError, TypeError):
+            return default
+        self._results.move_to_end(key)
+        return result
+
+    def set(self, source, result):
+        # Caches result of source(removes oldest result when full).
+        if self._max_size <= 0:
+            return
+        try:
+            key = self._create_key(source)
+            self._results[key] = result
+        except TypeError:
+            return
+        self._results.move_to_end(key)
+        if len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        self._results.clear()
+
+    def __len__(self):
+        return len(self._results)
+
+
+class ResultColumns():
+    # Results of many sources stored as columns(one value per source).
+    # Strings(e.g content types) are stored as codes from code tables
+    # and flags(e.g supported) as 0 or 1, see codes module.
+    # Source without resource has uri_type of 0(None).
+    CODE_COLUMNS = {
+        "uri_type": codes.uri_types,
+        "content_type": codes.content_types,
+        "encoding": codes.encodings,
+        "status": codes.statuses
+    }
+    FLAG_COLUMNS = ("supported", "resembles", "locally")
+
+    def __init__(self):
+        self._columns = collections.OrderedDict()
+        for name in self.CODE_COLUMNS:
+            # Unsigned int as code tables may grow past 65535 values
+            # (e.g many distinct content types) in long streams.
+            self._columns[name] = array.array("I")
+        for name in self.FLAG_COLUMNS:
+            self._columns[name] = array.array("B")
+
+    def append(self, info):
+        # Appends resource.ResourceInfo(or None) as new row.
+        for name, code_table in self.CODE_COLUMNS.items():
+            value = getattr(info, name) if info else None
+            self._columns[name].append(code_table.get_code(value))
+        for name in self.FLAG_COLUMNS:
+            value = getattr(info, name) if info else False
+            self._columns[name].append(1 if value else 0)
+
+    def get_column(self, name) -> array.array:
+        # Returns column(array of codes or flags) with name.
+        return self._columns[name]
+
+    def get_columns(self):
+        # Returns dict mapping names to columns
+        return dict(self._columns)
+
+    def get_tables(self):
+        # Returns lookup tables for code columns(code is index of value)
+        return {
+            name: code_table.get_values() for name, code_table in \
+                self.CODE_COLUMNS.items()
+        }
+
+    def decode(self, name, code):
+        # Decodes code(or flag) of column into its value
+        if name in self.CODE_COLUMNS:
+            return self.CODE_COLUMNS[name].get_value(code)
+        return bool(code)
+
+    def get_value(self, name, index):
+        # Returns decoded value of column at index(row)
+        return self.decode(name, self._columns[name][index])
+
+    def count(self, name):
+        # Counts occurences of each decoded value in column.
+        counts = collections.Counter(self._columns[name])
+        return {self.decode(name, code): count \
+            for code, count in counts.items()}
+
+    def rows(self):
+        # Yields rows as dicts with decoded values.
+        names = list(self._columns)
+        for index in range(len(self)):
+            yield {name: self.get_value(name, index) for name in names}
+
+    def __len__(self):
+        return len(self._columns["uri_type"])
+
+
+def create_record(resource):
+    # Creates compact and picklable record of resource.
+    # Record does not hold source or resource object.
+    if resource is None:
+        return None
+    return resource.to_info()
+
+def _can_be_shipped(source):
+    # Checks if source can be classified in another process.
+    # Other sources(e.g file objects) are classified in current process.
+    return type(source) in (str, bytes) or \
+        isinstance(source, pathlib.PurePath)
+
+def _classify_chunk(sources, strict, kwargs):
+    # Classifies chunk of sources into records(runs in worker process)
+    return [
+        create_record(highlevel.find_resource(source, strict, **kwargs)) \
+            for source in sources
+    ]
+
+def _iter_chunks(iterable, chunk_size):
+    # Yields lists of items from iterable with atmost chunk_size items
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _classify_in_current_process(sources, strict, cache, records, kwargs):
+    # Classifies sources one by one in current process.
+    missing = object()
+    for source in sources:
+        result = cache.get(source, missing)
+        if result is missing:
+            result = highlevel.find_resource(source, strict, **kwargs)
+            if records:
+                result = create_record(result)
+            cache.set(source, result)
+        yield result
+
+def _classify_in_processes(sources, strict, cache, processes, chunk_size,
+    kwargs):
+    # Classifies sources into records using pool of processes.
+    # Chunks of sources are sent to processes and results are yielded
+    # in same order as sources.
+    from concurrent import futures
+
+    missing = object()
+    # Maps keys of shipped sources whose chunks are not yet collected to
+    # future and position of their result, so that sources repeated in
+    # chunks in progress are shipped once.
+    in_flight = {}
+
+    def submit_chunk(executor, chunk):
+        # Submits sources of chunk that are not yet known.
+        results = []
+        shipped = collections.OrderedDict()
+        # Indexes of sources shipped with previous chunks.
+        borrowed = []
+        for index, source in enumerate(chunk):
+            result = cache.get(source, missing)
+            if result is missing and _can_be_shipped(source):
+                key = (type(source), source)
+                if key in in_flight:
+                    borrowed.append((index, in_flight[key]))
+                else:
+                    shipped.setdefault(key, []).append(index)
+            elif result is missing:
+                result = create_record(
+                    highlevel.find_resource(source, strict, **kwargs)
+                )
+                cache.set(source, result)
+            results.append(result)
+        shipped_sources = [key[1] for key in shipped]
+        future = None
+        if shipped_sources:
+            future = executor.submit(
+                _classify_chunk, shipped_sources, strict, kwargs
+            )
+            for position, key in enumerate(shipped):
+                in_flight[key] = (future, position)
+        return results, shipped, borrowed, future
+
+    def collect_chunk(results, shipped, borrowed, future):
+        # Fills results of chunk with results from process.
+        if future is not None:
+            for key, record in zip(shipped, future.result()):
+                cache.set(key[1], record)
+                for index in shipped[key]:
+                    results[index] = record
+                if in_flight.get(key, (None,))[0] is future:
+                    del in_flight[key]
+        for index, (other_future, position) in borrowed:
+            # Chunks are collected in order so other_future is done.
+            results[index] = other_future.result()[position]
+        return results
+
+    with futures.ProcessPoolExecutor(processes) as executor:
+        pending = collections.deque()
+        for chunk in _iter_chunks(sources, chunk_size):
+            pending.append(submit_chunk(executor, chunk))
+            # Limits chunks in progress to keep memory bounded.
+            while len(pending) > processes * 2:
+                yield from collect_chunk(*pending.popleft())
+        while pending:
+            yield from collect_chunk(*pending.popleft())
+
+
+def classify_many(sources, strict=False, cache_size=DEFAULT_CACHE_SIZE,
+    records=False, processes=None, chunk_size=DEFAULT_CHUNK_SIZE,
+    **kwargs):
+    # Finds resource for each source in iterable of sources.
+    # Works like find_resource() but for many sources at once.
+    # Results are yielded one by one(None for source without resource).
+    # Identical sources are classified once and share their result.
+    # records yields resource.ResourceInfo objects instead of resources.
+    # processes classifies chunks of sources in that number of processes
+    # which always yields records(resources cant be sent by processes).
+    cache = ResultsCache(cache_size)
+    if processes:
+        return _classify_in_processes(
+            sources, strict, cache, processes, chunk_size, kwargs
+        )
+    return _classify_in_current_process(
+        sources, strict, cache, records, kwargs
+    )
+
+def classify_columns(sources, strict=False, **kwargs):
+    # Classifies sources and stores results as columns.
+    # Uses far less memory than list of results(see ResultColumns).
+    # kwargs are passed to classify_many() e.g processes.
+    columns = ResultColumns()
+    for info in classify_many(sources, strict, records=True, **kwargs):
+        columns.append(info)
+    return columns
+
+
+if __name__ == "__main__":
+    sources = ["file.py", "https://example.com/", "file.py"]
+    for resource in classify_many(sources):
+        print(resource.uri_type)
@@ -0,0 +1,164 @@
+# Command line interface for classifying sources.
+# Sources are read line by line from files or stdin and results are
+# written to stdout as JSON Lines or TSV.
+# e.g: cat urls.txt | python -m resid --fields source uri_type
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+
+from . import batch
+
+
+# Fields that can be written for each source.
+# 'source' is the line read, others are keys of ResourceInfo.to_dict().
+FIELDS = (
+    "source",
+    "uri",
+    "uri_type",
+    "content_type",
+    "encoding",
+    "supported",
+    "resembles",
+    "available_localy",
+    "issues",
+    "status"
+)
+
+FORMATS = ("jsonl", "tsv")
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(
+        prog="resid",
+        description="Classifies sources(urls, file paths, etc) read "
+            "line by line from files or stdin."
+    )
+    parser.add_argument("files", nargs="*", default=["-"],
+        help="files with one source per line('-' for stdin)")
+    parser.add_argument("-s", "--strict", action="store_true",
+        help="only report resources supporting source")
+    parser.add_argument("-f", "--fields", nargs="+", choices=FIELDS,
+        default=list(FIELDS), metavar="FIELD",
+        help="fields to output: " + ", ".join(FIELDS))
+    parser.add_argument("--format", choices=FORMATS, default="jsonl",
+        help="output format(default: jsonl)")
+    parser.add_argument("--header", action="store_true",
+        help="write header row for tsv format")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+        help="number of worker processes(default: no processes)")
+    parser.add_argument("-b", "--batch-size", type=int,
+        default=batch.DEFAULT_CHUNK_SIZE,
+        help="sources sent to worker process at once")
+    parser.add_argument("--progress", type=float, default=None,
+        metavar="SECONDS", help="report throughput every SECONDS")
+    parser.add_argument("-q", "--quiet", action="store_true",
+        help="dont report throughput to stderr")
+    return parser
+
+
+def _use_surrogateescape(stream):
+    # Manifests may contain raw file system names that are not valid
+    # utf-8, their bytes are kept as surrogates same as os.fsdecode().
+    if hasattr(stream, "reconfigure"):
+        stream.reconfigure(errors="surrogateescape")
+
+def read_sources(paths):
+    # Yields sources(lines) from files one by one(empty lines skipped).
+    for path in paths:
+        if path == "-":
+            lines = sys.stdin
+        else:
+            lines = open(path, encoding="utf-8", errors="surrogateescape")
+        try:
+            for line in lines:
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+        finally:
+            if lines is not sys.stdin:
+                lines.close()
+
+
+def _format_tsv_value(value):
+    if value is None:
+        return ""
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    else:
+        return str(value).replace("\t", " ")
+
+def format_jsonl(values, fields):
+    return json.dumps(dict(zip(fields, values)))
+
+def format_tsv(values, fields):
+    return "\t".join(map(_format_tsv_value, values))
+
+
+class Throughput():
+    # Counts sources classified and reports rate to stderr.
+    def __init__(self, interval=None, stream=sys.stderr):
+        self._interval = interval
+        self._stream = stream
+        self._count = 0
+        self._start = time.monotonic()
+        self._last_report = self._start
+
+    def update(self, count=1):
+        self._count += count
+        if self._interval is not None:
+            now = time.monotonic()
+            if now - self._last_report >= self._interval:
+                self._last_report = now
+                self.report()
+
+    def report(self):
+        elapsed = time.monotonic() - self._start
+        rate = self._count / elapsed if elapsed else 0
+        message = "resid: {} sources in {:.2f}s ({:.0f} sources/s)\n"
+        self._stream.write(message.format(self._count, elapsed, rate))
+        self._stream.flush()
+
+
+def main(argv=None):
+    args = create_parser().parse_args(argv)
+    _use_surrogateescape(sys.stdin)
+    _use_surrogateescape(sys.stdout)
+    formatter = format_jsonl if args.format == "jsonl" else format_tsv
+    throughput = Throughput(None if args.quiet else args.progress)
+
+    # Sources are read twice, once for classifying and once for output.
+    # tee() only keeps sources not yet written(memory stays constant).
+    sources, output_sources = itertools.tee(read_sources(args.files))
+    records = batch.classify_many(
+        sources, args.strict, records=True, processes=args.workers,
+        chunk_size=args.batch_size
+    )
+    if args.format == "tsv" and args.header:
+        sys.stdout.write("\t".join(args.fields) + "\n")
+    try:
+        for source, record in zip(output_sources, records):
+            record = record.to_dict() if record else {}
+            values = [
+                source if field == "source" else record.get(field) \
+                    for field in args.fields
+            ]
+            sys.stdout.write(formatter(values, args.fields) + "\n")
+            throughput.update()
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output was closed early(e.g piped to 'head').
+        # Remaining output is discarded to avoid errors on exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    if not args.quiet:
+        throughput.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
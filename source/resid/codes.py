@@ -0,0 +1,51 @@
+# Maps values repeated across many results to small integer codes.
+# Content types, uri types and others are few but repeated millions of
+# times in batch results(see batch.classify_columns()).
+
+import threading
+
+
+class CodeTable():
+    # Assigns integer code to each distinct value(interning).
+    # Code 0 is reserved for None which means value is missing.
+    # Codes are never reassigned so they stay valid for whole process.
+    def __init__(self, values=()):
+        self._codes = {None: 0}
+        self._values = [None]
+        self._lock = threading.Lock()
+        for value in values:
+            self.get_code(value)
+
+    def get_code(self, value):
+        # Returns code of value(new code is assigned for new value)
+        try:
+            return self._codes[value]
+        except KeyError:
+            with self._lock:
+                if value not in self._codes:
+                    self._codes[value] = len(self._values)
+                    self._values.append(value)
+                return self._codes[value]
+
+    def get_value(self, code):
+        # Returns value for code(raises IndexError for unknown code)
+        return self._values[code]
+
+    def get_values(self):
+        # Returns values ordered by their codes(lookup table)
+        return tuple(self._values)
+
+    def __contains__(self, value):
+        return value in self._codes
+
+    def __len__(self):
+        return len(self._values)
+
+
+# Shared tables for values of resource.ResourceInfo fields.
+uri_types = CodeTable()
+content_types = CodeTable()
+encodings = CodeTable()
+statuses = CodeTable(
+    ["OK", "Not Supported(resembles)", "Not Supported(critically!!)"]
+)
@@ -1,6 +1,7 @@
 from . import pathmod
 from . import filepath
 from . import file_memory
+from . import sniff
 
 from . import urlmod
 from . import weburl
@@ -9,6 +10,10 @@ from . import resource
 from . import exceptions
 
 import os
+import mmap
+import stat
+import time
+import array
 
 
 # __all__ = [
@@ -22,6 +27,12 @@ import os
 
 class Document(resource.Resource): 
     _path_types = pathmod.PATH_TYPES
+    # Bytes read from start of contents to guess content type from them
+    # (see sniff module), None disables sniffing.
+    # Type guessed from contents takes precedence over type guessed from
+    # path unless its generic e.g zip for '.docx' file.
+    sniff_size = None
+    __slots__ = ()
 
     def __init__(self, source, content_type=None, encoding=None):
         super().__init__(source, content_type, encoding)
@@ -33,11 +44,14 @@ class Document(resource.Resource):
 
     def to_string(self):
         # Returns string version of source.
-        # source or path will be used if they are strings.
-        if self._source and isinstance(self._source, str):
-            return self._source
-        elif self.path and isinstance(self.path, str):
-            return self.path
+        # source or path will be used if they are strings(bytes are
+        # decoded with pathmod.decode_path()).
+        source = pathmod.decode_path(self._source)
+        if source and isinstance(source, str):
+            return source
+        path = pathmod.decode_path(self.path)
+        if path and isinstance(path, str):
+            return path
         else:
             return super().to_string()
 
@@ -45,19 +59,42 @@ class Document(resource.Resource):
         # Extracts path from source
         return ""
 
-    @property
+    @resource.memoized_property
     def path(self):
         return self.extract_path(self._source)
 
-    @property
-    def content_type(self):
+    def sniff_contents(self, size):
+        # Returns extension guessed from atmost size bytes of contents.
+        # Resources whose contents can be read override this.
+        return None
+
+    @resource.memoized_property
+    def sniffed_type(self):
+        # Content type and encoding guessed from contents or None.
+        # None also when type guessed from path should be used instead.
+        if not self.sniff_size:
+            return None
+        extension = self.sniff_contents(self.sniff_size)
+        if extension is None:
+            return None
+        guessed_type = None
         if self.path:
+            guessed_type = filepath.guess_content_type(self.path)
+        return sniff.choose_type(guessed_type, extension)
+
+    @resource.memoized_property
+    def content_type(self):
+        if self.sniffed_type and self.sniffed_type[0]:
+            return self.sniffed_type[0]
+        elif self.path:
             return filepath.guess_content_type(self.path)
 
-    @property
+    @resource.memoized_property
     def encoding(self):
         if super().encoding:
             return super().encoding
+        elif self.sniffed_type:
+            return self.sniffed_type[1]
         elif self.content_type:
             # Guessses encoding from existing content type
             extension = filepath.guess_extension(self.content_type)
@@ -66,56 +103,64 @@ class Document(resource.Resource):
 
 
 class URL(Document):
+    # bytes urls are decoded into strings(see pathmod.decode_path()) so
+    # that parts of url are always strings.
     _uri_type = "url"
+    _source_types = (str, bytes)
+    __slots__ = ()
+
+    def _get_url(self):
+        return pathmod.decode_path(self._source)
 
     def extract_path(self, url):
         # Extracts path from source
-        return urlmod.extract_path(self._source)
+        return urlmod.extract_path(self._get_url())
 
     def source_supported(self, source):
         # Checks if source is valid url
-        return urlmod.is_url(source)
+        return urlmod.is_url(pathmod.decode_path(source))
 
     def source_resembles(self, source):
         # Checks if source resembles url
-        return urlmod.resembles_url(source)
+        return urlmod.resembles_url(pathmod.decode_path(source))
 
     def available_locally(self, url):
-        return urlmod.is_locally_hosted(url)
+        return urlmod.is_locally_hosted(pathmod.decode_path(url))
 
     @property
     def hostname(self):
-        return urlmod.extract_hostname(self._source)
+        return urlmod.extract_hostname(self._get_url())
 
     @property
     def netloc(self):
-        return urlmod.extract_netloc(self._source)
+        return urlmod.extract_netloc(self._get_url())
 
     @property
     def scheme(self):
-        return urlmod.extract_scheme(self._source)
+        return urlmod.extract_scheme(self._get_url())
 
     @property
     def query(self):
-        return urlmod.extract_query(self._source)
+        return urlmod.extract_query(self._get_url())
 
     @property
     def params(self):
-        return urlmod.extract_params(self._source)
+        return urlmod.extract_params(self._get_url())
 
     @property
     def fragment(self):
-        return urlmod.extract_fragment(self._source)
+        return urlmod.extract_fragment(self._get_url())
 
     @property
     def port(self):
-        return urlmod.extract_port(self._source)
+        return urlmod.extract_port(self._get_url())
 
 
 class WebURL(URL):
     _uri_type = "web-url"
+    __slots__ = ()
 
-    @property
+    @resource.memoized_property
     def content_type(self):
         # Retrieves content type for contents of url
         if super().content_type:
@@ -123,26 +168,32 @@ class WebURL(URL):
         else:
             # html file is basic structure for webpage.
             # content type for webpage is same as that of html
-            return filepath.guess_content_type(" .html")
+            return filepath.extension_content_type(".html")
 
     def source_supported(self, source):
         # Checks if source is valid url for web
-        return weburl.is_web_url(source)
+        return weburl.is_web_url(pathmod.decode_path(source))
 
     def source_resembles(self, source):
         # Checks if source resembles url
-        return weburl.resembles_web_url(source)
+        return weburl.resembles_web_url(pathmod.decode_path(source))
 
     @property
     def is_webpage(self):
         # Checks if source(url) points to webpage
-        html_content_type = filepath.guess_content_type(" .html")
+        html_content_type = filepath.extension_content_type(".html")
         return html_content_type == self.content_type
  
 
 
 class Path(Document):
     _uri_type = "file-system-path"
+    _source_types = pathmod.PATH_TYPES
+    # Seconds for which os.stat() snapshot is reused, supported(and
+    # status) then expire with snapshot.
+    # None reuses snapshot until refresh() is called.
+    stat_ttl = None
+    __slots__ = ()
 
     def __init__(self, source, content_type=None, encoding=None):
         super().__init__(source, content_type, encoding)
@@ -153,8 +204,104 @@ class Path(Document):
         else:
             return path
 
+    def _get_stat_snapshot(self, path):
+        # Returns os.stat() results or error of path(see stat()).
+        if self._cache is None:
+            self._cache = {}
+        try:
+            key = ("stat", path)
+            created, snapshot = self._cache[key]
+        except TypeError:
+            # Path cannot be hashed(rare for custom path like objects)
+            return pathmod.stat_path(path)
+        except KeyError:
+            pass
+        else:
+            ttl = self.stat_ttl
+            if ttl is None or time.monotonic() - created <= ttl:
+                return snapshot
+        return self.set_stat(pathmod.stat_path(path), path)
+
+    def set_stat(self, snapshot, path=None):
+        # Sets os.stat() results or error to be reused for path.
+        # This is useful when stat results were retrieved elsewhere.
+        if path is None:
+            path = self.path
+        if self._cache is None:
+            self._cache = {}
+        self._cache[("stat", path)] = (time.monotonic(), snapshot)
+        return snapshot
+
+    def stat(self, path=None):
+        # Returns os.stat() results for path(defaults to resource path).
+        # Results are snapshot reused by every stat related property.
+        # Raises same error as os.stat() if stat failed.
+        if path is None:
+            path = self.path
+        snapshot = self._get_stat_snapshot(path)
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot
+
+    @property
+    def supported(self):
+        # Memoized unless stat_ttl is set, then its checked against stat
+        # snapshot every time so that it expires together with snapshot.
+        if self.stat_ttl is None:
+            return resource.Resource.supported.fget(self)
+        return self.source_supported(self._source)
+
+    def _path_exists(self, path):
+        # Same as os.path.exists() but uses stat snapshot
+        return not isinstance(self._get_stat_snapshot(path), Exception)
+
+    def _path_is_file(self, path):
+        # Same as os.path.isfile() but uses stat snapshot
+        snapshot = self._get_stat_snapshot(path)
+        if isinstance(snapshot, Exception):
+            return False
+        return stat.S_ISREG(snapshot.st_mode)
+
+    def _path_is_dir(self, path):
+        # Same as os.path.isdir() but uses stat snapshot
+        snapshot = self._get_stat_snapshot(path)
+        if isinstance(snapshot, Exception):
+            return False
+        return stat.S_ISDIR(snapshot.st_mode)
+
+    def _get_sniff_path(self):
+        # Returns path of file whose contents are sniffed.
+        return self._source
+
+    def set_sniff(self, extension, path=None):
+        # Sets extension sniffed from contents of file at path.
+        # This is useful when files were sniffed elsewhere(see sniff_many())
+        if path is None:
+            path = self._get_sniff_path()
+        if self._cache is None:
+            self._cache = {}
+        self._cache[("sniff", path)] = extension
+        return extension
+
+    def sniff_contents(self, size):
+        # Reads only start of file(see sniff.sniff_path()).
+        path = self._get_sniff_path()
+        try:
+            return self._cache[("sniff", path)]
+        except (KeyError, TypeError):
+            pass
+        if not self._path_is_file(path):
+            return None
+        return self.set_sniff(sniff.sniff_path(path, size), path)
+
+    def _get_stat_paths(self):
+        # Returns paths that may be stat(source and extracted path)
+        paths = [self._source, self.path]
+        return [path for path in dict.fromkeys(paths) \
+            if isinstance(path, pathmod.PATH_TYPES)]
+
     def source_supported(self, source):
-        return pathmod.is_path(source, strict=True)
+        return pathmod.is_path(source, self._path_exists, strict=True)
 
     def available_locally(self, path):
         return True
@@ -164,35 +311,40 @@ class Path(Document):
 
     @property
     def size(self):
-        return os.stat(self.path).st_size
+        return self.stat().st_size
 
     @property
     def access_time(self):
-        return os.stat(self.path).st_atime
+        return self.stat().st_atime
 
     @property
     def mod_time(self):
-        return os.stat(self.path).st_mtime
+        return self.stat().st_mtime
 
     @property
     def create_time(self):
-        return os.stat(self.path).st_ctime
+        return self.stat().st_ctime
 
 
 class DirPath(Path):
     _uri_type = "dir-path"
+    __slots__ = ()
 
     def source_supported(self, source):
-        return pathmod.is_dir_path(source, strict=True)
+        return pathmod.is_path(source, self._path_is_dir, strict=True)
 
     def source_resembles(self, source):
         return pathmod.resembles_dir(source)
 
-    def get_files(self, recursive=False):
-        return pathmod.get_folder_files(self.path, recursive)
+    def scan(self, recursive=False, **kwargs):
+        # Yields os.DirEntry objects for dirs and files(see pathmod.scan())
+        return pathmod.scan(self.path, recursive, **kwargs)
+
+    def get_files(self, recursive=False, **kwargs):
+        return pathmod.get_folder_files(self.path, recursive, **kwargs)
 
-    def get_dirs(self, recursive=False):
-        return pathmod.get_folder_dirs(self.path, recursive)
+    def get_dirs(self, recursive=False, **kwargs):
+        return pathmod.get_folder_dirs(self.path, recursive, **kwargs)
 
     @property
     def files(self):
@@ -212,10 +364,11 @@ class DirPath(Path):
 
 class FilePath(Path):
     _uri_type = "file-path"
+    __slots__ = ()
     def source_supported(self, source):
         # File path is expected to be string or bytes.
         # Pathlike, integers cant be used as path.
-        return pathmod.is_file_path(source, strict=True)
+        return pathmod.is_path(source, self._path_is_file, strict=True)
 
     def source_resembles(self, source):
         # Checks if source resembles path
@@ -223,6 +376,8 @@ class FilePath(Path):
 
 class PathLike(Path):
     _uri_type = "path-like-object"
+    _source_types = (os.PathLike,)
+    __slots__ = ()
     def extract_path(self, file_like):
         return file_like.name
 
@@ -238,18 +393,20 @@ class PathLike(Path):
 
 class DirPathLike(PathLike):
     _uri_type = "dir-path-like-object"
-    pass
+    __slots__ = ()
 
 class FilePathLike(PathLike):
     _uri_type = "file-path-like-object"
-    pass
+    __slots__ = ()
 
     
 
 class FilePathURL(URL, FilePath):
     _uri_type = "local-file-url"
+    _source_types = URL._source_types
+    __slots__ = ()
     def extract_path(self, file_path):
-        path_part = urlmod.extract_path(file_path)
+        path_part = urlmod.extract_path(pathmod.decode_path(file_path))
         # Decodes extracted path from url
         path_decoded = urlmod.unquote(path_part)
         # Removes leading(/) if path has drive part
@@ -258,17 +415,29 @@ class FilePathURL(URL, FilePath):
         return path_decoded
 
 
+    def _get_sniff_path(self):
+        return self.path
+
     def source_supported(self, source):
-        return urlmod.is_url(source, {"file"})
+        return urlmod.is_url(pathmod.decode_path(source), {"file"})
 
     def source_resembles(self, source):
-        return urlmod.resembles_url(source, {"file"})
+        return urlmod.resembles_url(pathmod.decode_path(source), {"file"})
 
     def available_locally(self, file):
         return True
  
 class FileMemory(Document):
     _uri_type = "file-like-object"
+    __slots__ = ()
+
+    @classmethod
+    def source_type_supported(cls, source_type):
+        # File objects are recognised by their attributes not type.
+        # Strings and paths are never file objects.
+        if issubclass(source_type, pathmod.PATH_TYPES):
+            return False
+        return super().source_type_supported(source_type)
     def set_path(self, path):
         # Sets associated with source
         if isinstance(path, pathmod.PATH_TYPES):
@@ -297,6 +466,75 @@ class FileMemory(Document):
     def available_locally(self, file):
         return True
 
+    def sniff_contents(self, size):
+        # File position is left unchanged(see sniff.sniff_file()).
+        return sniff.sniff_file(self._source, size)
+
+
+class Buffer(Document):
+    # Contents held in memory as buffer e.g bytearray, memoryview, mmap.
+    # Buffer is accessed in place, size and content type are found in
+    # constant time no matter how large buffer is.
+    _uri_type = "buffer"
+    _source_types = (bytearray, memoryview, mmap.mmap, array.array)
+    # Bytes looked at for guessing content type(None disables it).
+    sniff_size = sniff.DEFAULT_SNIFF_SIZE
+    __slots__ = ()
+
+    def source_supported(self, source):
+        # Released memoryview or closed mmap cant be accessed.
+        if not isinstance(source, self._source_types):
+            return False
+        try:
+            with memoryview(source):
+                return True
+        except ValueError:
+            return False
+
+    def available_locally(self, buffer):
+        return True
+
+    @property
+    def size(self):
+        # Returns size of buffer in bytes
+        with memoryview(self._source) as view:
+            return view.nbytes
+
+    def sniff_contents(self, size):
+        if self.supported:
+            return sniff.sniff_extension(self._source, size)
+
+
+def stat_many(resources, max_workers=None):
+    # Fills stat snapshots of many Path resources at once.
+    # Resources sharing same path share single os.stat() call.
+    # Returns dict mapping paths to os.stat() results or errors.
+    path_resources = [resource for resource in resources \
+        if isinstance(resource, Path)]
+    paths = [path for resource in path_resources \
+        for path in resource._get_stat_paths()]
+    snapshots = pathmod.stat_many(paths, max_workers)
+    for resource in path_resources:
+        for path in resource._get_stat_paths():
+            resource.set_stat(snapshots[path], path)
+    return snapshots
+
+def sniff_many(resources, max_workers=None):
+    # Sniffs contents of many Path resources at once(see sniff_paths()).
+    # Only resources with sniffing enabled are sniffed and single buffer
+    # is reused for all files(one per thread if max_workers is used).
+    # Returns dict mapping paths to sniffed extensions.
+    path_resources = [resource for resource in resources \
+        if isinstance(resource, Path) and resource.sniff_size]
+    if not path_resources:
+        return {}
+    size = max(resource.sniff_size for resource in path_resources)
+    paths = [resource._get_sniff_path() for resource in path_resources]
+    extensions = sniff.sniff_paths(paths, size, max_workers)
+    for resource, path in zip(path_resources, paths):
+        resource.set_sniff(extensions[path], path)
+    return extensions
+
 
 if __name__ == "__main__":
     import os
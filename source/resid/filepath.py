@@ -1,35 +1,183 @@
 import os
-import mimetypes
+import re
 import typing
+import posixpath
+import collections
+from types import MappingProxyType
 
 from . import pathmod
 
 
-if not mimetypes.inited:
-    mimetypes.init()
+# Types table is built from tables of mimetypes module.
+# True uses mime.types files of system(mimetypes.init() reads them).
+# False only uses types built into mimetypes module(no files are read).
+USE_SYSTEM_TYPES = True
 
-def _bytes_to_string(__object, *args, **kwargs):
-    # Convert bytes object to string.
-    # Other object types are returned unchanged.
-    if isinstance(__object, bytes):
-        return __object.decode(*args, **kwargs)
+# Immutable snapshot of mimetypes tables used for lookups.
+# types maps extensions to content types(non standard types included),
+# encodings maps extensions to encodings(e.g '.gz' to 'gzip'),
+# suffixes maps extensions to compound extensions(e.g '.tgz' to '.tar.gz')
+# and extensions maps content types to their extensions.
+TypesTable = collections.namedtuple(
+    "TypesTable", ["types", "encodings", "suffixes", "extensions"]
+)
+
+_types_table = None
+
+# Splits scheme from path(same as urllib.parse._splittype()).
+_SCHEME_PATTERN = re.compile("([^/:]+):(.*)", re.DOTALL)
+
+
+def _create_inverse_types(types_map):
+    # Maps content types to their extensions(same as mimetypes does)
+    inverse_types = {}
+    for extension, content_type in types_map.items():
+        extensions = inverse_types.setdefault(content_type, [])
+        if extension not in extensions:
+            extensions.append(extension)
+    return inverse_types
+
+def _get_mimetypes_tables(system):
+    # Returns types, common types, encodings and suffixes tables.
+    # Inverse types(strict and common) of types tables are also returned.
+    # mimetypes is imported here as its only needed for creating table.
+    import mimetypes
+    if not system and hasattr(mimetypes, "_types_map_default"):
+        strict_types = mimetypes._types_map_default
+        common_types = mimetypes._common_types_default
+        return (
+            strict_types,
+            common_types,
+            mimetypes._encodings_map_default,
+            mimetypes._suffix_map_default,
+            (
+                _create_inverse_types(strict_types),
+                _create_inverse_types(common_types)
+            )
+        )
+    if not mimetypes.inited:
+        mimetypes.init()
+    database = getattr(mimetypes, "_db", None)
+    if database is not None:
+        inverse_types = database.types_map_inv[True], \
+            database.types_map_inv[False]
     else:
-        return __object
+        inverse_types = (
+            _create_inverse_types(mimetypes.types_map),
+            _create_inverse_types(mimetypes.common_types)
+        )
+    return (
+        mimetypes.types_map,
+        mimetypes.common_types,
+        mimetypes.encodings_map,
+        mimetypes.suffix_map,
+        inverse_types
+    )
+
+def create_types_table(system=None) -> TypesTable:
+    # Creates snapshot of mimetypes tables(see USE_SYSTEM_TYPES).
+    if system is None:
+        system = USE_SYSTEM_TYPES
+    strict_types, common_types, encodings, suffixes, inverse_types = \
+        _get_mimetypes_tables(system)
+    # Standard types take precedence over non standard(common) ones.
+    types = dict(common_types)
+    types.update(strict_types)
+    # Extensions are in same order as in mimetypes.guess_all_extensions().
+    # Like mimetypes, content types are looked up in lower case.
+    extensions = {}
+    for inverse_types_map in inverse_types:
+        for content_type, type_extensions in inverse_types_map.items():
+            content_type_extensions = extensions.setdefault(
+                content_type, []
+            )
+            for extension in type_extensions:
+                if extension not in content_type_extensions:
+                    content_type_extensions.append(extension)
+    extensions = {
+        content_type: tuple(values) for content_type, values in \
+            extensions.items()
+    }
+    return TypesTable(
+        MappingProxyType(types),
+        MappingProxyType(dict(encodings)),
+        MappingProxyType(dict(suffixes)),
+        MappingProxyType(extensions)
+    )
+
+def get_types_table() -> TypesTable:
+    # Returns types table(created on first use).
+    global _types_table
+    if _types_table is None:
+        _types_table = create_types_table()
+    return _types_table
+
+def refresh_types_table(system=None) -> TypesTable:
+    # Creates types table again e.g after types were added to mimetypes.
+    global _types_table
+    _types_table = create_types_table(system)
+    return _types_table
+
+
+def _bytes_to_string(__object):
+    # Convert bytes object to string(see pathmod.decode_path()).
+    # Other object types are returned unchanged.
+    return pathmod.decode_path(__object)
+
+def _guess_data_url_type(data_url):
+    # Guesses content type of data url(without 'data:' part)
+    comma = data_url.find(',')
+    if comma < 0:
+        return None
+    semi = data_url.find(';', 0, comma)
+    content_type = data_url[:semi] if semi >= 0 else data_url[:comma]
+    if '=' in content_type or '/' not in content_type:
+        return 'text/plain'
+    return content_type
+
+def guess_type(file_path):
+    # Guesses content type and encoding of file path.
+    # Works same as mimetypes.guess_type(file_path, False) but uses
+    # types table for lookups.
+    table = _types_table or get_types_table()
+    file_path = _bytes_to_string(os.fspath(file_path))
+    if ":" in file_path:
+        match = _SCHEME_PATTERN.match(file_path)
+        if match:
+            scheme, file_path = match.groups()
+            if scheme.lower() == "data":
+                return _guess_data_url_type(file_path), None
+    base, extension = posixpath.splitext(file_path)
+    suffixes = table.suffixes
+    while extension.lower() in suffixes:
+        base, extension = posixpath.splitext(
+            base + suffixes[extension.lower()]
+        )
+    # Encodings are case sensitive unlike content types
+    encoding = table.encodings.get(extension)
+    if encoding is not None:
+        base, extension = posixpath.splitext(base)
+    return table.types.get(extension.lower()), encoding
 
 def guess_content_type(file_path):
-    file_path = _bytes_to_string(file_path)
-    return mimetypes.guess_type(file_path, False)[0]
+    return guess_type(file_path)[0]
 
 def guess_encoding(file_path):
-    file_path = _bytes_to_string(file_path)
-    return mimetypes.guess_type(file_path, False)[1]
+    return guess_type(file_path)[1]
 
 def guess_extension(content_type):
-    return mimetypes.guess_extension(content_type, False)
+    extensions = guess_extensions(content_type)
+    if extensions:
+        return extensions[0]
 
 def guess_extensions(content_type):
-    file_path = _bytes_to_string(file_path)
-    return mimetypes.guess_all_extensions(content_type, False)
+    table = _types_table or get_types_table()
+    return list(table.extensions.get(content_type.lower(), ()))
+
+def extension_content_type(extension):
+    # Returns content type of extension e.g 'text/html' for '.html'.
+    table = _types_table or get_types_table()
+    return table.types.get(extension.lower())
 
 def equal_content_type(file_path, other_file_path):
     # Returns True if files paths have same content type
@@ -41,6 +189,15 @@ def equal_content_type(file_path, other_file_path):
         return False
 
 
+def content_type_filter(*content_types):
+    # Creates filter callback for pathmod.scan() matching content types.
+    # Content type is guessed from name of directory entry.
+    content_types = set(content_types)
+    def callback(entry):
+        return guess_content_type(entry.name) in content_types
+    return callback
+
+
 def extract_extension(file_path):
     return os.path.splitext(file_path)[1]
 
@@ -52,40 +209,44 @@ def remove_extension(filename: str):
 
 
     
+def _has_content_type_of(file_path, *extensions):
+    # Checks if file path has content type of any of extensions
+    content_type = guess_content_type(file_path)
+    if content_type:
+        for extension in extensions:
+            if content_type == extension_content_type(extension):
+                return True
+    return False
+
 def is_pdf_file(file_path):
-    return equal_content_type(file_path, " .pdf")
+    return _has_content_type_of(file_path, ".pdf")
 
 def is_docx_file(file_path):
-    return equal_content_type(file_path, " .docx")
+    return _has_content_type_of(file_path, ".docx")
 
 def is_doc_file(file_path):
-    return equal_content_type(file_path, " .doc")
+    return _has_content_type_of(file_path, ".doc")
 
 def is_word_file(file_path):
-    return is_docx_file(file_path) or is_doc_file(file_path)
+    return _has_content_type_of(file_path, ".docx", ".doc")
 
 def is_pptx_file(file_path):
-    return equal_content_type(file_path, " .pptx")
+    return _has_content_type_of(file_path, ".pptx")
 
 def is_ppt_file(file_path):
-    return equal_content_type(file_path, " .ppt")
+    return _has_content_type_of(file_path, ".ppt")
 
 def is_html_file(file_path):
-    if equal_content_type(file_path, " .html"):
-        return True
-    elif equal_content_type(file_path, " .htm"):
-        return True
-    else:
-        return False
+    return _has_content_type_of(file_path, ".html", ".htm")
 
 def is_json_file(file_path):
-    return equal_content_type(file_path, " .json")
+    return _has_content_type_of(file_path, ".json")
 
 def is_csv_file(file_path):
-    return equal_content_type(file_path, " .csv")
+    return _has_content_type_of(file_path, ".csv")
 
 def is_plain_text_file(file_path):
-    return equal_content_type(file_path, " .txt")
+    return _has_content_type_of(file_path, ".txt")
 
 def is_text_file(file_path):
     content_type = guess_content_type(file_path)
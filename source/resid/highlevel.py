@@ -8,6 +8,7 @@ from . import document
 __all__ = [
     "find_resource",
     "find_resources",
+    "find_resource_info",
     "guess_content_type",
     "guess_encoding",
     "locally_hosted",
@@ -25,38 +26,33 @@ __all__ = [
     "is_file_path_url",
     "is_url",
     "is_web_url",
-    "is_file_like"
+    "is_file_like",
+    "is_buffer"
 ]
 
 def find_resources(source, strict=False, **kwargs):
     # Find resources instances closely related to source.
-    # master contains resource objects created from source.
-    master_obj = master.Master(source, **kwargs)
-    # Gets supported resources from master.
-    # Supported resources clearly matches the source.
-    # Supported resources take precidence over resembled ones.
-    supported_resources = master_obj.supported_resources
-    if supported_resources:
-        return supported_resources
-    elif not strict:
-        # Gets resources resembling source.
-        # Resemblimg resources are not guaranteed to be supported.
-        # e.g url may still be invalid or file path not existing.
-        return master_obj.resembles_resources
-    else:
-        return []
+    # Supported resources clearly matches the source and take precidence
+    # over resembled ones.
+    # Resemblimg resources are not guaranteed to be supported.
+    # e.g url may still be invalid or file path not existing.
+    return master.get_classifier().find_all(source, strict, **kwargs)
     
 def find_resource(source, strict=False, **kwargs):
     # Find resource instance supporting or resembling source.
     # Returns None if source cannot satisfy any of resource object.
     # find_resources() but performance may be impacted.
     # Supported resource has priority over resmbling ones.
-    master_obj = master.Master(source, **kwargs)
-    supported_resource = master_obj.supported_resource
-    if supported_resource:
-        return supported_resource
-    elif not strict:
-        return master_obj.resembles_resource
+    return master.get_classifier().find(source, strict, **kwargs)
+
+
+def find_resource_info(source, strict=False, **kwargs):
+    # Finds resource and returns its summary(see resource.ResourceInfo).
+    # Returns None if source cannot satisfy any of resource object.
+    # Summary is cheaper to keep than resource object.
+    resource_object = find_resource(source, strict, **kwargs)
+    if resource_object:
+        return resource_object.to_info()
 
 
 def _find_resource_types(source, strict=False, **kwargs):
@@ -129,6 +125,9 @@ def _source_matches_resource_type(source, resource_type, strict=False):
     # Checks if ssource upports or resembles resource type(class)
     # resource_types = _find_resource_types(source, strict)
     # return resource_type in resource_types
+    if not resource_type.source_type_supported(type(source)):
+        # Source type alone is enough to reject source.
+        return False
     _resource = resource_type(source)
     supported = _resource.supported
     if supported:
@@ -170,6 +169,10 @@ def is_file_like(source, strict=False):
     # Checks if source is file like object
     return _source_matches_resource_type(source, document.FileMemory, strict)
 
+def is_buffer(source, strict=False):
+    # Checks if source is in memory buffer e.g bytearray, mmap
+    return _source_matches_resource_type(source, document.Buffer, strict)
+
 def is_memory_file(source, strict=False):
     # Checks if source is file like object
     return is_file_like(source, strict)
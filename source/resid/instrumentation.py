@@ -0,0 +1,254 @@
+# Counts and times expensive operations done while classifying sources.
+# Operations: url parsing, os.stat() calls, temporary file probes,
+# local ip address lookups(dns), folder reads and content sniffing.
+# Operations are grouped by resource type(see document module) and by
+# high level function(see highlevel module) doing them.
+#
+# Instrumentation is disabled by default and costs nothing then.
+# Enabling it replaces functions doing operations with wrappers that
+# record them, disabling it puts back original functions.
+# e.g
+#   resid.enable_instrumentation()
+#   resid.find_resource("file.txt")
+#   resid.stats()["operations"]["stat"] -> {"count": 1, "seconds": ...}
+
+import sys
+import time
+import threading
+import functools
+import contextvars
+
+from . import urlmod
+from . import sniff
+from . import pathmod
+from . import document
+from . import resource
+from . import highlevel
+
+
+__all__ = [
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "instrumentation_enabled",
+    "stats",
+    "reset_stats",
+    "add_stats_callback",
+    "remove_stats_callback"
+]
+
+# Maps operations to functions(module, name) doing them.
+OPERATIONS = {
+    "url-parse": [(urlmod, "urlparse")],
+    "stat": [(pathmod, "stat_path")],
+    "probe": [(pathmod, "_probe_path")],
+    "dns": [
+        (urlmod, "_get_local_adress"),
+        (urlmod, "_get_local_ip_adresses")
+    ],
+    "scan": [(pathmod, "_scan_folder")],
+    "sniff": [(sniff, "sniff_file"), (sniff, "sniff_path")]
+}
+
+# Operation recorded for each call to high level function.
+CALL_OPERATION = "call"
+
+# High level function and resource type doing operation.
+_current_function = contextvars.ContextVar("function", default=None)
+_current_resource_type = contextvars.ContextVar("resource_type", default=None)
+
+# Maps (operation, function, resource type) to [count, seconds].
+_records = {}
+_callbacks = ()
+_lock = threading.RLock()
+# Original attributes replaced by wrappers(owner, name, value).
+_patched = []
+# Original value of attribute that did not exist(deleted on disable).
+_MISSING = object()
+
+
+def _record(operation, seconds, function, resource_type):
+    key = (operation, function, resource_type)
+    with _lock:
+        try:
+            record = _records[key]
+        except KeyError:
+            record = _records[key] = [0, 0.0]
+        record[0] += 1
+        record[1] += seconds
+    for callback in _callbacks:
+        callback(operation, seconds, function, resource_type)
+
+def _wrap_operation(operation, function):
+    # Returns wrapper recording each call of function as operation.
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(
+                operation,
+                time.perf_counter() - start,
+                _current_function.get(),
+                _current_resource_type.get()
+            )
+    return wrapper
+
+def _wrap_highlevel_function(name, function):
+    # Returns wrapper setting function as one doing operations.
+    # High level functions called by other ones(e.g guess_type() calls
+    # find_resource()) dont take over operations of calling function.
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _current_function.get() is not None:
+            return function(*args, **kwargs)
+        token = _current_function.set(name)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(CALL_OPERATION, time.perf_counter() - start, name, None)
+            _current_function.reset(token)
+    return wrapper
+
+def _wrap_method(method):
+    # Returns wrapper setting type of resource as one doing operations.
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = _current_resource_type.set(type(self).__name__)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _current_resource_type.reset(token)
+    return wrapper
+
+
+def _get_resource_types():
+    # Returns resource classes whose methods are wrapped.
+    resource_types = [resource.Resource]
+    for value in vars(document).values():
+        if isinstance(value, type) and \
+            issubclass(value, resource.Resource) and \
+            value.__module__ == document.__name__:
+            resource_types.append(value)
+    return resource_types
+
+def _get_replacements():
+    # Yields (owner, name, wrapper) for attributes to be replaced.
+    for operation, attributes in OPERATIONS.items():
+        for module, name in attributes:
+            wrapper = _wrap_operation(operation, getattr(module, name))
+            yield module, name, wrapper
+
+    # Package caches high level functions on first access(see its
+    # __getattr__()), so they are patched on package too even if not yet
+    # accessed. Otherwise wrapper cached while enabled would remain.
+    package = sys.modules[__package__]
+    for name in highlevel.__all__:
+        wrapper = _wrap_highlevel_function(name, getattr(highlevel, name))
+        yield highlevel, name, wrapper
+        yield package, name, wrapper
+
+    for resource_type in _get_resource_types():
+        for name, value in list(vars(resource_type).items()):
+            if name.startswith("__"):
+                continue
+            elif isinstance(value, property) and value.fget:
+                wrapper = property(
+                    _wrap_method(value.fget), value.fset, value.fdel,
+                    value.__doc__
+                )
+                yield resource_type, name, wrapper
+            elif isinstance(value, (classmethod, staticmethod, type)):
+                continue
+            elif callable(value):
+                yield resource_type, name, _wrap_method(value)
+
+
+def enable_instrumentation():
+    # Starts recording operations(does nothing if already enabled).
+    with _lock:
+        if _patched:
+            return
+        for owner, name, wrapper in list(_get_replacements()):
+            _patched.append((owner, name, vars(owner).get(name, _MISSING)))
+            setattr(owner, name, wrapper)
+
+def disable_instrumentation():
+    # Stops recording operations(recorded stats are kept).
+    with _lock:
+        while _patched:
+            owner, name, original = _patched.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+def instrumentation_enabled():
+    return bool(_patched)
+
+
+def _add_stat(stats_dict, operation, count, seconds):
+    stat = stats_dict.setdefault(operation, {"count": 0, "seconds": 0.0})
+    stat["count"] += count
+    stat["seconds"] += seconds
+
+def stats(reset=False):
+    # Returns snapshot of recorded operations as dict:
+    #   "operations": totals of each operation
+    #   "functions": operations of each high level function('call' is
+    #       for calls of function itself)
+    #   "resource_types": operations of each resource type
+    # Each operation has "count" and "seconds"(total time taken).
+    # reset discards recorded stats after taking snapshot.
+    with _lock:
+        records = [(key, tuple(value)) for key, value in _records.items()]
+        if reset:
+            _records.clear()
+    snapshot = {
+        "enabled": instrumentation_enabled(),
+        "operations": {},
+        "functions": {},
+        "resource_types": {}
+    }
+    for (operation, function, resource_type), (count, seconds) in records:
+        if operation != CALL_OPERATION:
+            _add_stat(snapshot["operations"], operation, count, seconds)
+        if function is not None:
+            function_stats = snapshot["functions"].setdefault(function, {})
+            _add_stat(function_stats, operation, count, seconds)
+        if resource_type is not None:
+            resource_stats = snapshot["resource_types"].setdefault(
+                resource_type, {}
+            )
+            _add_stat(resource_stats, operation, count, seconds)
+    return snapshot
+
+def reset_stats():
+    # Discards recorded stats.
+    with _lock:
+        _records.clear()
+
+
+def add_stats_callback(callback):
+    # Adds callback called after every recorded operation with
+    # (operation, seconds, function, resource_type).
+    # function and resource_type are None if not known.
+    # Useful for exporting operations to metrics systems.
+    global _callbacks
+    with _lock:
+        _callbacks = (*_callbacks, callback)
+
+def remove_stats_callback(callback):
+    global _callbacks
+    with _lock:
+        callbacks = list(_callbacks)
+        callbacks.remove(callback)
+        _callbacks = tuple(callbacks)
+
+
+if __name__ == "__main__":
+    enable_instrumentation()
+    highlevel.guess_content_type(__file__)
+    highlevel.is_url("https://example.com/index.html")
+    print(stats())
@@ -8,6 +8,7 @@ from . import document
 from typing import List
 from typing import Type
 from typing import Iterable
+from typing import Iterator
 
 
 # Default resources classes(order matters)
@@ -28,27 +29,173 @@ _DEFAULT_RESOURCE_TYPES = (
 
     # file like object
     document.FileMemory,
+
+    # in memory buffer(bytearray, memoryview, mmap)
+    document.Buffer,
 )
 resources_types = [*_DEFAULT_RESOURCE_TYPES]
 
 
 
+class DispatchTable():
+    # Maps type of source to resource types that may accept it.
+    # Resource types declare source types they accept, most resource
+    # types can reject source just from its type(see Resource class).
+    # Table is filled as new source types are seen.
+    def __init__(self, resource_types) -> None:
+        self._resource_types = tuple(resource_types)
+        self._table = {}
+
+    def get_indexes(self, source_type):
+        # Returns indexes of resource types accepting source type.
+        try:
+            return self._table[source_type]
+        except KeyError:
+            indexes = tuple(
+                index for index, resource_type in \
+                    enumerate(self._resource_types) \
+                    if resource_type.source_type_supported(source_type)
+            )
+            self._table[source_type] = indexes
+            return indexes
+
+    def get_resource_types(self, source_type):
+        # Returns resource types accepting source type(order is kept)
+        indexes = self.get_indexes(source_type)
+        return [self._resource_types[index] for index in indexes]
+
+
+# Dispatch tables for resources types already seen.
+# Resources types are usually the same for every source.
+_dispatch_tables = {}
+_MAX_DISPATCH_TABLES = 32
+
+def get_dispatch_table(resource_types) -> DispatchTable:
+    # Returns dispatch table for resource types(table is reused)
+    key = tuple(resource_types)
+    try:
+        return _dispatch_tables[key]
+    except KeyError:
+        if len(_dispatch_tables) >= _MAX_DISPATCH_TABLES:
+            _dispatch_tables.clear()
+        dispatch_table = _dispatch_tables[key] = DispatchTable(key)
+        return dispatch_table
+
+
 class ResourceTypes():
     # Manages Resource types(classes) to be used by Master class.
-    # Class is not used in favour of list of Resource objects.
+    # Can be used as registry of resource types for Classifier.
     def __init__(self, resources_types) -> None:
         self._resource_types = list(resources_types)
 
-    def add_resource_type(self, resource_type):
-        self._resource_types.add(resource_type)
+    def add_resource_type(self, resource_type, index=None):
+        # Adds resource type at index(end if not provided).
+        # Resource type already added is not added again.
+        if resource_type in self._resource_types:
+            return
+        if index is None:
+            self._resource_types.append(resource_type)
+        else:
+            self._resource_types.insert(index, resource_type)
+
+    def remove_resource_type(self, resource_type):
+        # Removes resource type(nothing happens if it was not added).
+        if resource_type in self._resource_types:
+            self._resource_types.remove(resource_type)
 
-    def remove_resource_type_(self, resource_type):
-        self._resource_types.discard(resource_type)
+    # Kept for compatibility(name had trailing underscore).
+    remove_resource_type_ = remove_resource_type
 
     def get_resource_types(self):
         return self._resource_types
 
 
+class Classifier():
+    # Finds resources for any number of sources using resource types.
+    # Unlike Master, classifier is not bound to source and is created
+    # once, resource types accepting each source type(dispatch plan) are
+    # found once and reused for every source of that type.
+    # Resource types are taken from ResourceTypes or any iterable and
+    # later changes to them dont affect classifier.
+    def __init__(self, resource_types=None) -> None:
+        if resource_types is None:
+            resource_types = resources_types
+        elif isinstance(resource_types, ResourceTypes):
+            resource_types = resource_types.get_resource_types()
+        self._resource_types = tuple(resource_types)
+        self._dispatch_table = DispatchTable(self._resource_types)
+        # Maps source types to resource types accepting them.
+        self._plans = {}
+        for source_type in (str, bytes):
+            self.get_plan(source_type)
+
+    def get_resource_types(self):
+        return self._resource_types
+
+    def get_plan(self, source_type):
+        # Returns resource types accepting source type(order is kept).
+        try:
+            return self._plans[source_type]
+        except KeyError:
+            plan = tuple(self._dispatch_table.get_resource_types(source_type))
+            self._plans[source_type] = plan
+            return plan
+
+    def find_all(self, source, strict=False, **kwargs):
+        # Returns resources supporting source or resembling it if none
+        # supports it(see highlevel.find_resources()).
+        # strict returns only supported resources.
+        resources = [resource_type(source, **kwargs) for resource_type \
+            in self.get_plan(type(source))]
+        supported_resources = [resource for resource in resources \
+            if resource.supported]
+        if supported_resources:
+            return supported_resources
+        elif not strict:
+            return [resource for resource in resources if resource.resembles]
+        return []
+
+    def find(self, source, strict=False, **kwargs):
+        # Returns first resource supporting source or resembling it if
+        # none supports it(see highlevel.find_resource()).
+        # Resources are created in order and only until one supports
+        # source, None is returned if no resource is found.
+        resources = []
+        for resource_type in self.get_plan(type(source)):
+            resource_object = resource_type(source, **kwargs)
+            if resource_object.supported:
+                return resource_object
+            resources.append(resource_object)
+        if not strict:
+            for resource_object in resources:
+                if resource_object.resembles:
+                    return resource_object
+        return None
+
+    def classify(self, source, strict=False, **kwargs):
+        # Returns resource type(class) of resource found by find() or None.
+        resource_object = self.find(source, strict, **kwargs)
+        if resource_object is not None:
+            return type(resource_object)
+        return None
+
+
+# Classifier shared by high level functions(see get_classifier()).
+_default_classifier = None
+_default_classifier_types = None
+
+def get_classifier() -> Classifier:
+    # Returns shared classifier for resources_types.
+    # Classifier is created again when resources_types changed.
+    global _default_classifier, _default_classifier_types
+    classifier = _default_classifier
+    if classifier is None or _default_classifier_types != resources_types:
+        classifier = Classifier(resources_types)
+        _default_classifier_types = list(resources_types)
+        _default_classifier = classifier
+    return classifier
+
+
 class Resources():
     # Manages Resource instances to be used by Master class.
     def __init__(self, resources: Iterable[resource.Resource]) -> None:
@@ -60,68 +207,92 @@ class Resources():
     def get_resources(self):
         return self._resources
 
+    def iter_resources(self) -> Iterator[resource.Resource]:
+        # Yields resources one by one.
+        # Subclasses may create resources only when they are needed.
+        return iter(self._resources)
+
+    def iter_candidate_resources(self) -> Iterator[resource.Resource]:
+        # Yields resources that may support or resemble source.
+        # Other resources are known to neither support nor resemble it.
+        return self.iter_resources()
+
+    def _iter_filter(self, resources, callback):
+        # Yields resources satisfying callback(stops when not needed)
+        return filter(callback, resources)
+
     def _filter(self, resources, callback) -> List[resource.Resource]:
         # returns list with filtered resources by provided callback
-        return list(filter(callback, resources))
+        return list(self._iter_filter(resources, callback))
 
     def _single_filter(self, resources, callback) -> resource.Resource:
-        # Returns first resource satisfyting callback
-        for resource in resources:
-            if callback(resource):
-                return resource
+        # Returns first resource satisfyting callback.
+        # Resources after the first one are never evaluated.
+        for resource in self._iter_filter(resources, callback):
+            return resource
         return None
 
+    def iter_supported_resources(self):
+        # Yields supported resources
+        resources = self.iter_candidate_resources()
+        return self._iter_filter(resources, lambda res: res.supported)
+
+    def iter_resembles_resources(self):
+        # Yields resources resembling source
+        resources = self.iter_candidate_resources()
+        return self._iter_filter(resources, lambda res: res.resembles)
+
     @property
     def supported_resources(self):
         # Returns list of supported resources
-        return self._filter(self._resources, lambda res: res.supported)
+        return list(self.iter_supported_resources())
 
     @property
     def resembles_resources(self):
         # Returns list of resources resembling source
-        return self._filter(self._resources, lambda res: res.resembles)
+        return list(self.iter_resembles_resources())
 
     @property
     def issues_resources(self):
         # Returns list of resources with issues
-        return self._filter(self._resources, lambda res: res.issues)
+        return self._filter(self.iter_resources(), lambda res: res.issues)
 
     @property
     def success_resources(self):
         # Returns list of success resources.
         # This is opposite of issues_resources.
-        return self._filter(self._resources, lambda res: res.success)
+        return self._filter(self.iter_resources(), lambda res: res.success)
 
 
     @property
     def supported_resource(self):
         # Returns first resource supported.
-        callback = lambda res: res.supported
-        return self._single_filter(self._resources, callback)
+        return next(self.iter_supported_resources(), None)
 
     @property
     def resembles_resource(self):
         # Returns first resource resembling its source
-        callback = lambda res: res.resembles
-        return self._single_filter(self._resources, callback)
+        return next(self.iter_resembles_resources(), None)
 
     @property
     def issues_resource(self):
         # Returns first resource with issues
         callback = lambda res: res.issues
-        return self._single_filter(self._resources, callback)
+        return self._single_filter(self.iter_resources(), callback)
 
     @property
     def success_resource(self):
         # Returns first success resource.
         callback = lambda res: res.success
-        return self._single_filter(self._resources, callback)
+        return self._single_filter(self.iter_resources(), callback)
 
 
 class Master(Resources):
     # Master class for Resource classes.
     # Creates Resource instances on request and help in accessing them.
     # Internally creates instances as compared to parent class Resources.
+    # Instances are created lazily in order of resource types and only
+    # when needed e.g supported_resource stops at first supported one.
     def __init__(self, source, *args, **kwargs):
         super().__init__(list())
         self._source = source
@@ -143,18 +314,49 @@ class Master(Resources):
     def get_resources_types(self):
         return self._resource_types
 
+    def get_resources(self):
+        # Returns resources for all resource types(creates missing ones)
+        return list(self.iter_resources())
+
+    def iter_resources(self):
+        # Yields resource objects in order of resource types.
+        # Resource object is created when reached and reused afterwards.
+        return map(self.__get_resource, range(len(self._resource_types)))
+
+    def iter_candidate_resources(self):
+        # Yields resource objects whose types accept type of source.
+        # Resource types rejecting source type are never instantiated.
+        return map(self.__get_resource, self._candidate_indexes)
 
-    def __create_resources(self):
-        # Creates resources objects for source using resources classes.
-        def func(resource_type):
-            return resource_type(self._source, *self._args, **self._kwargs)
-        # Convert to list to avoid iterator from getting exausted.
-        # That is common with python iterator
-        return list(map(func, self._resource_types))
+    @property
+    def created_resources(self):
+        # Returns resources objects created so far.
+        # Useful for measuring how much work lazy resolution saved.
+        return [self._created[index] for index in sorted(self._created)]
+
+
+    def __get_resource(self, index):
+        # Returns resource object for resource type at index.
+        try:
+            return self._created[index]
+        except KeyError:
+            resource_type = self._resource_types[index]
+            resource_object = self.__create_resource(resource_type)
+            self._created[index] = resource_object
+            return resource_object
+
+    def __create_resource(self, resource_type):
+        # Creates resource object for source using resource class.
+        return resource_type(self._source, *self._args, **self._kwargs)
 
     def __update_resources(self):
-        # Updates resource resources by creating new instances.
-        self._resources = self.__create_resources()
+        # Discards resource objects created from previous resource types.
+        # New resource objects will be created when needed.
+        self._created = {}
+        dispatch_table = get_dispatch_table(self._resource_types)
+        self._candidate_indexes = dispatch_table.get_indexes(
+            type(self._source)
+        )
 
 
 if __name__ == "__main__":
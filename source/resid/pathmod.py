@@ -1,9 +1,11 @@
 import os
-import glob
+import re
+import stat
+import collections
 import typing
-from urllib import parse
 
-import tempfile
+from . import urlmod
+
 
 # Defines allowed types for paths
 PATH_TYPES = (str, bytes, os.PathLike)
@@ -11,37 +13,307 @@ _PATH = typing.Union[str, bytes, os.PathLike]
 
 # Max size of characters pathname(e.g filename) can have.
 # This does not mean the whole path.
-MAX_PATH_NAME_LENGTH = 100
+# Most file systems limit names to 255 characters(bytes on posix).
+MAX_PATH_NAME_LENGTH = 255
+
+# Default number of threads for reading folders in parallel.
+DEFAULT_SCAN_WORKERS = 8
+
+# Characters that cannot be part of path name.
+# Windows also reserves some names for devices(e.g 'CON').
+if os.name == "nt":
+    _FORBIDDEN_NAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+    _RESERVED_NAMES = frozenset(
+        ["CON", "PRN", "AUX", "NUL"] +
+        ["COM{}".format(number) for number in range(1, 10)] +
+        ["LPT{}".format(number) for number in range(1, 10)]
+    )
+else:
+    _FORBIDDEN_NAME_CHARS = re.compile(r'[/\x00]')
+    _RESERVED_NAMES = frozenset()
+
+
+def _entry_is_dir(entry):
+    # Checks if directory entry is dir(symlinks to dirs included)
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+def _entry_is_file(entry):
+    # Checks if directory entry is file(symlinks to files included)
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+def _scan_folder(folder, prune_callback=None, filter_callback=None):
+    # Returns entries of folder and sub-folders to walk into.
+    # Folder that cannot be read has no entries(similar to os.walk()).
+    try:
+        with os.scandir(folder) as entries_iterator:
+            entries = list(entries_iterator)
+    except OSError:
+        return [], []
+    dirs_entries = []
+    files_entries = []
+    for entry in entries:
+        if _entry_is_dir(entry):
+            dirs_entries.append(entry)
+        else:
+            files_entries.append(entry)
+    entries = dirs_entries + files_entries
+    if filter_callback is not None:
+        entries = list(filter(filter_callback, entries))
+    # Symlinks to dirs are not followed to avoid endless loops.
+    sub_folders = [
+        entry.path for entry in dirs_entries \
+            if not entry.is_symlink() and \
+            not (prune_callback and prune_callback(entry))
+    ]
+    return entries, sub_folders
+
+def scan(path: _PATH, recursive=False, prune_callback=None,
+    filter_callback=None, max_depth=None, max_workers=None, 
+    ordered=True, max_pending=None) -> typing.Iterator[os.DirEntry]:
+    # Yields os.DirEntry objects for paths(dirs, files) in provided path.
+    # Entries already know their types, so no extra stat is needed.
+    # Dirs are yielded before files of same folder(sub-folders after).
+    # prune_callback(entry) returning True skips walking into dir entry.
+    # filter_callback(entry) returning False excludes entry from results.
+    # max_depth limits how deep sub-folders are walked(0 for path only).
+    # max_workers walks sub-folders in parallel(see parallel_scan()),
+    # max_pending limits folders read ahead of consumer.
+    if max_workers and max_workers > 1:
+        return parallel_scan(
+            path, recursive, prune_callback, filter_callback, max_depth,
+            max_workers, ordered, max_pending
+        )
+    return _serial_scan(
+        path, recursive, prune_callback, filter_callback, max_depth
+    )
+
+def _serial_scan(path, recursive, prune_callback, filter_callback,
+    max_depth):
+    # Walks folders one by one on current thread(see scan())
+    folders = [(path, 0)]
+    while folders:
+        folder, depth = folders.pop()
+        entries, sub_folders = _scan_folder(
+            folder, prune_callback, filter_callback
+        )
+        yield from entries
+        if recursive and (max_depth is None or depth < max_depth):
+            folders.extend(
+                (sub_folder, depth+1) for sub_folder in reversed(sub_folders)
+            )
+
+def parallel_scan(path: _PATH, recursive=False, prune_callback=None,
+    filter_callback=None, max_depth=None, max_workers=DEFAULT_SCAN_WORKERS,
+    ordered=True, max_pending=None) -> typing.Iterator[os.DirEntry]:
+    # Same as scan() but sub-folders are read by pool of threads.
+    # Useful on file systems with slow round trips(e.g network).
+    # ordered yields entries in same order as scan() does, otherwise
+    # entries of folders are yielded as soon as folders are read.
+    # max_pending limits folders being read or read but not yet yielded
+    # (defaults to 4 x max_workers), folders are read ahead of
+    # consumer only up to that limit so memory stays bounded.
+    # Callbacks are called from worker threads.
+    from concurrent import futures
+
+    if max_pending is None:
+        max_pending = max_workers * 4
+    max_pending = max(1, max_pending)
+    executor = futures.ThreadPoolExecutor(max_workers)
+    # Futures of folders submitted but not yet yielded.
+    outstanding = set()
+
+    def submit(folder):
+        future = executor.submit(
+            _scan_folder, folder, prune_callback, filter_callback
+        )
+        outstanding.add(future)
+        return future
+
+    def get_result(future):
+        outstanding.discard(future)
+        return future.result()
+
+    def get_sub_folders(sub_folders, depth):
+        # Returns sub-folders to be walked with their depth.
+        if recursive and (max_depth is None or depth < max_depth):
+            return [(sub_folder, depth+1) for sub_folder in sub_folders]
+        return []
+
+    try:
+        if ordered:
+            # Stack of [folder, depth, future, sub-folders] in same order
+            # as scan(). sub-folders are known once folder is read.
+            stack = [[path, 0, None, None]]
+
+            def get_sub_folders_items(item):
+                if item[3] is None:
+                    _, sub_folders = item[2].result()
+                    item[3] = [
+                        [sub_folder, depth, None, None] for sub_folder, depth
+                        in get_sub_folders(sub_folders, item[1])
+                    ]
+                return item[3]
+
+            def fill():
+                # Submits folders in order they will be yielded(including
+                # sub-folders of folders read ahead) up to max_pending.
+                iterators = [reversed(stack)]
+                running = sum(not future.done() for future in outstanding)
+                while iterators and len(outstanding) < max_pending and \
+                    running < max_workers:
+                    item = next(iterators[-1], None)
+                    if item is None:
+                        iterators.pop()
+                    elif item[2] is None:
+                        item[2] = submit(item[0])
+                        running += 1
+                    elif item[2].done() and item[2].exception() is None:
+                        # Errors are raised once consumer reaches folder.
+                        iterators.append(iter(get_sub_folders_items(item)))
+
+            fill()
+            while stack:
+                item = stack[-1]
+                # Keeps workers busy with next folders while waiting.
+                while item[2] is None or not item[2].done():
+                    running = [f for f in outstanding if not f.done()]
+                    futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                    fill()
+                stack.pop()
+                entries, _ = get_result(item[2])
+                stack.extend(reversed(get_sub_folders_items(item)))
+                # Next folders are read while entries are consumed.
+                fill()
+                yield from entries
+        else:
+            folders = collections.deque([(path, 0)])
+            pending = {}
+
+            def fill():
+                while folders and len(pending) < max_pending:
+                    folder, depth = folders.popleft()
+                    pending[submit(folder)] = depth
 
+            fill()
+            while pending:
+                done, _ = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    depth = pending.pop(future)
+                    entries, sub_folders = get_result(future)
+                    folders.extend(get_sub_folders(sub_folders, depth))
+                    fill()
+                    yield from entries
+    finally:
+        # Folders not yet read are no longer needed.
+        for future in outstanding:
+            future.cancel()
+        executor.shutdown(wait=True)
 
-def walk(path: _PATH, recursive=False):
+def walk(path: _PATH, recursive=False, **kwargs):
     # Returns paths(dirs, files) in provided path.
     # recursive if True match paths in sub-folder recursively.
-    for root, directories, filenames in os.walk(path):
-        for pathname in directories + filenames:
-            yield os.path.join(root, pathname)
-        if not recursive:
-            break
+    # kwargs are passed to scan() e.g prune_callback, max_workers.
+    return (entry.path for entry in scan(path, recursive, **kwargs))
 
 def filter_files(paths: typing.Iterable[_PATH]):
-    return filter(os.path.isfile, paths)
+    return filter(path_is_file, paths)
 
 def filter_dirs(paths: typing.Iterable[_PATH]):
-    return filter(os.path.isdir, paths)
+    return filter(path_is_dir, paths)
 
+def extension_filter(*extensions):
+    # Creates filter callback matching entries with extensions.
+    # Extensions are matched case insensitively e.g '.txt'.
+    extensions = {extension.lower() for extension in extensions}
+    def callback(entry):
+        return os.path.splitext(entry.name)[1].lower() in extensions
+    return callback
 
-def get_folder_files(path: _PATH, recursive=False):
+
+def scan_files(path: _PATH, recursive=False, **kwargs):
+    # Yields os.DirEntry objects for files in folder
+    return filter(_entry_is_file, scan(path, recursive, **kwargs))
+
+def scan_dirs(path: _PATH, recursive=False, **kwargs):
+    # Yields os.DirEntry objects for dirs in folder
+    return filter(_entry_is_dir, scan(path, recursive, **kwargs))
+
+def get_folder_files(path: _PATH, recursive=False, **kwargs):
     # Returns file paths in folder
-    return filter_files(walk(path, recursive))
+    entries = scan_files(path, recursive, **kwargs)
+    return (entry.path for entry in entries)
 
-def get_folder_dirs(path: _PATH, recursive=False):
+def get_folder_dirs(path: _PATH, recursive=False, **kwargs):
     # Returns file paths in folder
-    return filter_dirs(walk(path, recursive)) 
+    entries = scan_dirs(path, recursive, **kwargs)
+    return (entry.path for entry in entries)
+
+def stat_path(path):
+    # Returns os.stat() results of path or exception raised by os.stat().
+    # Exception is returned so that it can be stored and raised later.
+    try:
+        return os.stat(path)
+    except (OSError, ValueError) as error:
+        # Traceback is dropped as it keeps frames alive while stored.
+        return error.with_traceback(None)
+
+def path_exists(path):
+    # Same as os.path.exists() but stat is done with stat_path()
+    return not isinstance(stat_path(path), Exception)
+
+def path_is_file(path):
+    # Same as os.path.isfile() but stat is done with stat_path()
+    result = stat_path(path)
+    return not isinstance(result, Exception) and stat.S_ISREG(result.st_mode)
+
+def path_is_dir(path):
+    # Same as os.path.isdir() but stat is done with stat_path()
+    result = stat_path(path)
+    return not isinstance(result, Exception) and stat.S_ISDIR(result.st_mode)
+
+def stat_many(paths: typing.Iterable[_PATH], max_workers=None):
+    # Returns dict mapping paths to results of stat_path().
+    # Each distinct path is stat once.
+    # max_workers sets threads to use(useful on network file systems).
+    paths = list(dict.fromkeys(paths))
+    if max_workers and max_workers > 1 and len(paths) > 1:
+        from concurrent import futures
+        with futures.ThreadPoolExecutor(max_workers) as executor:
+            return dict(zip(paths, executor.map(stat_path, paths)))
+    return {path: stat_path(path) for path in paths}
 
 def glob_pattern_paths(glob_path, recursive=False):
+    import glob
     return glob.glob(glob_path, recursive=recursive)
 
 
+# Last bytes path decoded and its string(see decode_path()).
+_last_decoded = (None, None)
+
+def decode_path(path):
+    # Decodes bytes path into string same as os.fsdecode(), undecodable
+    # bytes become surrogates which os.fsencode() turns back into bytes.
+    # Other objects are returned unchanged.
+    # Last decoded path is remembered so that resources created for same
+    # bytes source(see master module) decode it only once.
+    global _last_decoded
+    if isinstance(path, bytes):
+        last_path, last_string = _last_decoded
+        if last_path is path:
+            return last_string
+        string = os.fsdecode(path)
+        _last_decoded = (path, string)
+        return string
+    return path
+
 def extract_drive(path):
     return os.path.splitdrive(path)[0]
 
@@ -49,41 +321,88 @@ def remove_drive(path):
     return os.path.splitdrive(path)[1]
 
 
-def is_path(_source, exists_callback=None, strict=True):
+def is_valid_path_name(name):
+    # Checks if name can be used as path name(e.g filename).
+    # Check is done without accessing file system.
+    if isinstance(name, bytes):
+        length = len(name)
+        name = os.fsdecode(name)
+    elif os.name == "nt":
+        length = len(name)
+    else:
+        try:
+            length = len(os.fsencode(name))
+        except UnicodeEncodeError:
+            # Name cannot be represented on file system.
+            return False
+    if not name or length > MAX_PATH_NAME_LENGTH:
+        return False
+    elif _FORBIDDEN_NAME_CHARS.search(name):
+        return False
+    elif os.name == "nt" and name not in {".", ".."}:
+        # Windows strips trailing dots and spaces from names.
+        if name[-1] in ". ":
+            return False
+        return name.split(".")[0].rstrip().upper() not in _RESERVED_NAMES
+    else:
+        return True
+
+def is_valid_path(path):
+    # Checks if path is syntactically valid(it may not exist).
+    # Every name in path is checked with is_valid_path_name().
+    path = decode_path(os.fspath(path))
+    if "\0" in path:
+        return False
+    path = remove_drive(path)
+    if os.altsep:
+        path = path.replace(os.altsep, os.sep)
+    path_names = filter(None, path.split(os.sep))
+    return all(map(is_valid_path_name, path_names))
+
+def _probe_path(path):
+    # Checks if path is valid by creating temporary file with it.
+    # This accesses file system and is slower than is_valid_path().
+    import tempfile
+    try:
+        with tempfile.NamedTemporaryFile('w', prefix=path):
+            pass
+    except (OSError, ValueError):
+        return False
+    else:
+        return True
+
+def is_path(_source, exists_callback=None, strict=True, probe=False):
+    # Checks if source is path.
+    # strict requires path to exist(checked with exists_callback).
+    # Otherwise path only needs to be valid(it may not exist).
+    # probe uses temporary file to check validity of path.
     if exists_callback == None:
-        exists_callback = os.path.exists
+        exists_callback = path_exists
     if isinstance(_source, PATH_TYPES):
         if strict:
             return exists_callback(_source)
+        elif probe:
+            return exists_callback(_source) or _probe_path(_source)
         else:
-            if exists_callback(_source):
-                return True
-            else:
-                try:
-                    with tempfile.NamedTemporaryFile('w', prefix=_source):
-                        pass
-                except OSError:
-                    return False
-                else:
-                    return True
+            return is_valid_path(_source)
     else:
         return False
 
 
 def is_file_path(_source, strict=True):
-    return is_path(_source, os.path.isfile, strict)
+    return is_path(_source, path_is_file, strict)
 
 def is_dir_path(_source, strict=True):
-    return is_path(_source, os.path.isdir, strict)
+    return is_path(_source, path_is_dir, strict)
 
-def resembles_path(_source):
+def resembles_path(_source, probe=False):
     # Guesses if object resembles path
     if _source and isinstance(_source, PATH_TYPES):
         if isinstance(_source, os.PathLike):
             return True
-        _source = str(_source)
+        _source = decode_path(_source)
         drive, path = os.path.splitdrive(_source)
-        parsed = parse.urlparse(_source)
+        parsed = urlmod.urlparse(_source)
 
         if parsed.netloc or parsed.params:
             # Path cant have hostname(likely other urls)
@@ -95,7 +414,7 @@ def resembles_path(_source):
             path = os.path.normpath(path)
             path_names = filter(None, path.split(os.sep))
             for path_name in path_names:
-                if not is_path(path_name, os.path.exists, False):
+                if not is_path(path_name, path_exists, False, probe):
                     return False
             return True
 
@@ -104,7 +423,7 @@ def resembles_dir(_source):
     # Guesses if object resembles directory path
     if resembles_path(_source):
         # dir should not have to end with path sep or extension.
-        path = os.path.normcase(_source)
+        path = os.path.normcase(decode_path(os.fspath(_source)))
         extension = os.path.splitext(path)[1]
         return path.endswith(os.sep) or not extension
     else:
@@ -114,7 +433,7 @@ def resembles_file_path(_source):
     # Guesses if object resembles file path
     if resembles_path(_source):
         #extension = os.path.splitext(_source)[1]
-        path = os.path.normcase(_source)
+        path = os.path.normcase(decode_path(os.fspath(_source)))
         return not path.endswith(os.sep)
     else:
         return False
@@ -1,5 +1,102 @@
 from . import exceptions
 
+import functools
+
+
+def memoized_property(method):
+    # Creates property whose value is computed once per instance.
+    # Values are stored in '_cache' of instance and can be discarded
+    # with Resource.invalidate() e.g when file system changed.
+    key = (method.__name__, method.__qualname__)
+    @functools.wraps(method)
+    def getter(self):
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = method(self)
+            return value
+    return property(getter)
+
+
+class ResourceInfo():
+    # Compact and immutable summary of resource(see Resource.to_info()).
+    # Stores values of resource properties but not source or resource.
+    # Its cheaper to keep than resource and can be pickled.
+    __slots__ = (
+        "uri",
+        "uri_type",
+        "content_type",
+        "encoding",
+        "supported",
+        "resembles",
+        "locally",
+        "status"
+    )
+
+    def __init__(self, uri, uri_type, content_type, encoding, supported,
+        resembles, locally, status):
+        values = (uri, uri_type, content_type, encoding, supported,
+            resembles, locally, status)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResourceInfo object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ResourceInfo object is immutable")
+
+    def __reduce__(self):
+        return (type(self), self.values())
+
+    def __eq__(self, other):
+        if isinstance(other, ResourceInfo):
+            return self.values() == other.values()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.values())
+
+    def __repr__(self):
+        items = ", ".join(
+            "{}={!r}".format(name, getattr(self, name)) \
+                for name in self.__slots__
+        )
+        return "{}({})".format(type(self).__name__, items)
+
+    def values(self):
+        # Returns tuple with values of fields(in order of __slots__)
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_dict(self):
+        # Returns dict with same keys as Resource.to_dict()
+        return {
+            "uri": self.uri,
+            "uri_type": self.uri_type,
+            "content_type": self.content_type,
+            "encoding": self.encoding,
+            "supported": self.supported,
+            "resembles": self.resembles,
+            "available_localy": self.locally,
+            "issues": self.issues,
+            "status": self.status
+        }
+
+    @property
+    def issues(self):
+        return not (self.supported or self.resembles)
+
+    @property
+    def success(self):
+        return not self.issues
+
+    @property
+    def remotely(self):
+        return not self.locally
+
 
 class Resource(): 
     # Base class for analysing source for information like content type.
@@ -8,12 +105,25 @@ class Resource():
     # located locally and others.
     # This is the most important class in this library.
     _uri_type = None
+    # Types of sources that resource may support or resemble.
+    # Sources of other types are never supported or resembled.
+    # Used by master module to skip resource types by source type.
+    _source_types = (object,)
+    # Memoized values are stored in '_cache'(see memoized_property()).
+    # Subclasses should define __slots__ to keep objects small.
+    __slots__ = ("_source", "_content_type", "_encoding", "_cache")
 
     def __init__(self, source, content_type:str=None, encoding:str=None):
         self._source = source
         self._content_type = content_type
         self._encoding = encoding
+        self._cache = None
 
+    @classmethod
+    def source_type_supported(cls, source_type):
+        # Checks if sources of source_type may be supported or resembled.
+        # False means source of that type will never be supported.
+        return issubclass(source_type, cls._source_types)
 
     def _validate_source(self):
         # Raises exception when source is not supported
@@ -48,6 +158,37 @@ class Resource():
             "status": self.status
         }
 
+    def invalidate(self, *attributes):
+        # Discards memoized values of attributes(all if not provided).
+        # Values will be computed again when accessed.
+        if not self._cache:
+            return
+        elif attributes:
+            for key in list(self._cache):
+                if key[0] in attributes:
+                    del self._cache[key]
+        else:
+            self._cache.clear()
+
+    def refresh(self):
+        # Discards everything known about source e.g file existence.
+        # Should be called when source changed(e.g file was deleted).
+        self.invalidate()
+
+    def to_info(self):
+        # Returns immutable summary of resource(see ResourceInfo class).
+        # Every value is computed in one pass.
+        return ResourceInfo(
+            self.uri,
+            self.uri_type,
+            self.content_type,
+            self.encoding,
+            self.supported,
+            self.resembles,
+            self.locally,
+            self.status
+        )
+
     def available_locally(self, source):
         # Checks if source data is available on this local machine
         return False
@@ -57,11 +198,11 @@ class Resource():
         # That does not mean source is supported.
         return self.source_supported(source)
 
-    @property
+    @memoized_property
     def supported(self):
         return self.source_supported(self._source)
 
-    @property
+    @memoized_property
     def resembles(self):
         return self.source_resembles(self._source)
 
@@ -77,20 +218,20 @@ class Resource():
     def status(self):
         if self.supported:
             return "OK"
-        elif self.source_resembles(self._source):
+        elif self.resembles:
             return "Not Supported(resembles)"
         else:
             return "Not Supported(critically!!)"
 
-    @property
+    @memoized_property
     def locally(self):
         return self.available_locally(self._source)
 
     @property
     def remotely(self):
-        return not self.available_locally(self._source)
+        return not self.locally
 
-    @property
+    @memoized_property
     def uri(self):
         return self.to_string()
 
@@ -120,6 +261,8 @@ class Generic(Resource):
     # This can include path which can be dir path or url path.
     # Or url which can be web url, local file url, etc.
     # Sources for in this class do
+    __slots__ = ()
+
     def source_supported(self, source):
         # Does not need to be supported as its too generic
         return False
@@ -0,0 +1,303 @@
+# Guesses type of contents from their first bytes(magic numbers).
+# Signatures map magic bytes to extensions whose content type and
+# encoding are taken from filepath types table e.g b'%PDF-' is '.pdf'.
+# File objects are sniffed without consuming them, position is left
+# unchanged and atmost few hundred bytes are read into reused buffer.
+# Files at paths are read with os.preadv() into reused buffer without
+# creating file objects.
+
+import io
+import os
+import threading
+import functools
+import collections
+
+from . import filepath
+
+
+# Max bytes read from start of contents for sniffing.
+# Signatures dont go beyond 262 bytes(tar header).
+DEFAULT_SNIFF_SIZE = 512
+
+# Signature is matched when every part(offset, magic) matches.
+Signature = collections.namedtuple("Signature", ["parts", "extension"])
+
+SIGNATURES = [
+    Signature(((0, b"%PDF-"),), ".pdf"),
+    Signature(((0, b"\x89PNG\r\n\x1a\n"),), ".png"),
+    Signature(((0, b"\xff\xd8\xff"),), ".jpg"),
+    Signature(((0, b"GIF87a"),), ".gif"),
+    Signature(((0, b"GIF89a"),), ".gif"),
+    Signature(((0, b"II*\x00"),), ".tif"),
+    Signature(((0, b"MM\x00*"),), ".tif"),
+    Signature(((0, b"\x00\x00\x01\x00"),), ".ico"),
+    Signature(((0, b"8BPS"),), ".psd"),
+    Signature(((0, b"RIFF"), (8, b"WEBP")), ".webp"),
+    Signature(((0, b"RIFF"), (8, b"WAVE")), ".wav"),
+    Signature(((0, b"RIFF"), (8, b"AVI ")), ".avi"),
+    Signature(((0, b"OggS"),), ".ogg"),
+    Signature(((0, b"fLaC"),), ".flac"),
+    Signature(((0, b"ID3"),), ".mp3"),
+    Signature(((4, b"ftyp"),), ".mp4"),
+    Signature(((0, b"\x1a\x45\xdf\xa3"),), ".mkv"),
+    Signature(((0, b"FLV\x01"),), ".flv"),
+    Signature(((0, b"PK\x03\x04"),), ".zip"),
+    Signature(((0, b"PK\x05\x06"),), ".zip"),
+    Signature(((0, b"\x1f\x8b\x08"),), ".gz"),
+    Signature(((0, b"BZh"),), ".bz2"),
+    Signature(((0, b"\xfd7zXZ\x00"),), ".xz"),
+    Signature(((0, b"7z\xbc\xaf\x27\x1c"),), ".7z"),
+    Signature(((0, b"Rar!\x1a\x07"),), ".rar"),
+    Signature(((257, b"ustar"),), ".tar"),
+    Signature(((0, b"wOFF"),), ".woff"),
+    Signature(((0, b"wOF2"),), ".woff2"),
+    Signature(((0, b"SQLite format 3\x00"),), ".sqlite"),
+    Signature(((0, b"{\\rtf"),), ".rtf"),
+    Signature(((0, b"%!PS"),), ".ps"),
+    Signature(((0, b"\x00asm"),), ".wasm"),
+    Signature(((0, b"\xca\xfe\xba\xbe"),), ".class")
+]
+
+# Markup is matched case insensitively after byte order mark and
+# whitespace e.g '  <!DOCTYPE html>'.
+TEXT_SIGNATURES = [
+    (b"<!doctype html", ".html"),
+    (b"<html", ".html"),
+    (b"<?xml", ".xml"),
+    (b"<svg", ".svg")
+]
+
+# Sniffed extensions shared by many formats e.g '.docx' and '.jar' files
+# are zip files. Type guessed from name is more specific than them.
+GENERIC_EXTENSIONS = frozenset(
+    [".zip", ".xml", ".mp4", ".ogg", ".mkv", ".gz", ".bz2", ".xz"]
+)
+
+_BYTE_ORDER_MARK = b"\xef\xbb\xbf"
+_WHITESPACE = frozenset(b" \t\r\n")
+
+
+class SignatureTable():
+    # Signatures compiled for matching(see match()).
+    # Signatures starting at offset 0 are indexed by their first byte so
+    # that only few signatures are compared for each contents.
+    def __init__(self, signatures, text_signatures=()):
+        self._indexed = {}
+        self._others = []
+        # Longer signatures are more specific so they are tried first.
+        signatures = sorted(signatures, key=self._get_length, reverse=True)
+        for signature in signatures:
+            offset, magic = signature.parts[0]
+            if offset == 0:
+                self._indexed.setdefault(magic[0], []).append(signature)
+            else:
+                self._others.append(signature)
+        self._text_signatures = tuple(text_signatures)
+        self._text_size = max(
+            (len(magic) for magic, _ in self._text_signatures), default=0
+        )
+        # Bytes needed to match every signature.
+        self.size = max(
+            [offset + len(magic) for signature in signatures \
+                for offset, magic in signature.parts] + [self._text_size]
+        )
+
+    @staticmethod
+    def _get_length(signature):
+        return sum(len(magic) for _, magic in signature.parts)
+
+    @staticmethod
+    def _matches(head, signature):
+        for offset, magic in signature.parts:
+            if head[offset:offset+len(magic)] != magic:
+                return False
+        return True
+
+    def _match_text(self, head):
+        # Skips byte order mark and whitespace before markup.
+        start = len(_BYTE_ORDER_MARK) if \
+            head[:len(_BYTE_ORDER_MARK)] == _BYTE_ORDER_MARK else 0
+        while start < len(head) and head[start] in _WHITESPACE:
+            start += 1
+        # Only few bytes are copied for case insensitive comparison.
+        prefix = head[start:start+self._text_size].tobytes().lower()
+        for magic, extension in self._text_signatures:
+            if prefix.startswith(magic):
+                return extension
+
+    def match(self, head: memoryview):
+        # Returns extension of first signature matching head or None.
+        if not head:
+            return None
+        for signature in self._indexed.get(head[0], ()):
+            if self._matches(head, signature):
+                return signature.extension
+        for signature in self._others:
+            if self._matches(head, signature):
+                return signature.extension
+        if self._text_signatures:
+            return self._match_text(head)
+
+
+_signature_table = SignatureTable(SIGNATURES, TEXT_SIGNATURES)
+
+def add_signature(extension, *parts):
+    # Adds signature made of (offset, magic) parts for extension.
+    # e.g add_signature(".elf", (0, b"\x7fELF"))
+    global _signature_table
+    SIGNATURES.append(Signature(tuple(parts), extension))
+    _signature_table = SignatureTable(SIGNATURES, TEXT_SIGNATURES)
+
+
+def sniff_extension(data, size=DEFAULT_SNIFF_SIZE):
+    # Returns extension guessed from first bytes of data or None.
+    # data can be any bytes like object(bytes, bytearray, memoryview,
+    # mmap) and atmost size bytes of it are looked at(no copies).
+    with memoryview(data) as view:
+        if view.format != "B" or view.ndim != 1:
+            if not view.c_contiguous:
+                # Bytes of view are not in order.
+                return None
+            view = view.cast("B")
+        return _signature_table.match(view[:size])
+
+def _guess_type(extension):
+    # Returns content type and encoding of sniffed extension or None if
+    # neither is known(e.g extension missing from types table).
+    if extension is None:
+        return None
+    guessed_type = filepath.guess_type("sniffed" + extension)
+    if guessed_type == (None, None):
+        return None
+    return guessed_type
+
+def sniff_type(data, size=DEFAULT_SNIFF_SIZE):
+    # Returns content type and encoding guessed from first bytes of data.
+    # e.g ('application/pdf', None) or (None, 'gzip') for gzip data.
+    # None is returned if nothing could be guessed.
+    return _guess_type(sniff_extension(data, size))
+
+
+def choose_type(guessed_type, extension):
+    # Returns content type and encoding of sniffed extension or None if
+    # guessed_type(e.g from file name) should be used instead.
+    # Sniffed extension wins unless its generic(see GENERIC_EXTENSIONS)
+    # or its type is not known.
+    if extension is None:
+        return None
+    elif guessed_type and extension in GENERIC_EXTENSIONS:
+        return None
+    return _guess_type(extension)
+
+
+# Buffer reused for reading from files(one per thread).
+_local = threading.local()
+
+def _get_buffer(size):
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = _local.buffer = bytearray(size)
+    return buffer
+
+def _read_head(file, size):
+    # Reads atmost size bytes from current position of file.
+    # Bytes are read into reused buffer when file supports readinto().
+    readinto = getattr(file, "readinto", None)
+    if readinto is None:
+        data = file.read(size)
+        if not isinstance(data, (bytes, bytearray)):
+            # Text file(characters are not bytes).
+            return None
+        return memoryview(data)
+    view = memoryview(_get_buffer(size))[:size]
+    filled = 0
+    while filled < size:
+        count = readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return view[:filled]
+
+def sniff_file(file, size=DEFAULT_SNIFF_SIZE):
+    # Returns extension guessed from first bytes of file object.
+    # Position of file is left unchanged and atmost size bytes are read
+    # with peek() or seek-and-restore.
+    # None is returned for text files and streams that cant be rewound
+    # (e.g pipes, sockets) as reading them may block until data arrives.
+    if isinstance(file, io.TextIOBase):
+        return None
+    try:
+        if isinstance(file, io.BytesIO):
+            # Contents are accessed in place without copying them.
+            with file.getbuffer() as view:
+                return sniff_extension(view, size)
+        peek = getattr(file, "peek", None)
+        seekable = getattr(file, "seekable", None)
+        if seekable is not None and seekable():
+            position = file.tell()
+            if position == 0 and peek is not None:
+                return sniff_extension(peek(size), size)
+            try:
+                file.seek(0)
+                head = _read_head(file, size)
+                return sniff_extension(head, size) if head is not None \
+                    else None
+            finally:
+                file.seek(position)
+    except (OSError, ValueError):
+        # File may be closed or not readable.
+        return None
+    return None
+
+def sniff_file_type(file, size=DEFAULT_SNIFF_SIZE):
+    # Returns content type and encoding guessed from first bytes of file.
+    # None is returned if nothing could be guessed.
+    return _guess_type(sniff_file(file, size))
+
+
+# Files are opened without blocking(e.g named pipes without writer).
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | \
+    getattr(os, "O_NONBLOCK", 0)
+
+def _read_path_head(path, size):
+    # Reads atmost size bytes from start of file at path.
+    # Returns view of reused buffer holding bytes read.
+    view = memoryview(_get_buffer(size))[:size]
+    fd = os.open(path, _OPEN_FLAGS)
+    try:
+        if hasattr(os, "preadv"):
+            count = os.preadv(fd, [view], 0)
+        else:
+            # Windows has no pread(), file was just opened at offset 0.
+            data = os.read(fd, size)
+            count = len(data)
+            view[:count] = data
+    finally:
+        os.close(fd)
+    return view[:count]
+
+def sniff_path(path, size=DEFAULT_SNIFF_SIZE):
+    # Returns extension guessed from first bytes of file at path.
+    # Atmost size bytes are read, file is never read fully.
+    # None is returned if file cant be read(e.g missing or folder).
+    try:
+        return sniff_extension(_read_path_head(path, size), size)
+    except (OSError, ValueError, TypeError):
+        return None
+
+def sniff_paths(paths, size=DEFAULT_SNIFF_SIZE, max_workers=None):
+    # Returns dict mapping paths to results of sniff_path().
+    # Each distinct path is read once and single buffer is reused for
+    # all files(one buffer per thread if max_workers is used).
+    paths = list(dict.fromkeys(paths))
+    sniff = functools.partial(sniff_path, size=size)
+    if max_workers and max_workers > 1 and len(paths) > 1:
+        from concurrent import futures
+        with futures.ThreadPoolExecutor(max_workers) as executor:
+            return dict(zip(paths, executor.map(sniff, paths)))
+    return {path: sniff(path) for path in paths}
+
+
+if __name__ == "__main__":
+    print(sniff_type(b"%PDF-1.7\n"))
+    print(sniff_file(io.BytesIO(b"\x89PNG\r\n\x1a\n....")))
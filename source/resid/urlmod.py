@@ -1,15 +1,90 @@
 from . import exceptions
 
-import socket
+import os
+import time
+import functools
+import threading
 from urllib import parse
 
 
 LOCAL_HOST_NAMES = {"localhost", "127.0.0.1"}
 
+# Seconds for which ip addresses of local machine are reused.
+# None reuses them until refresh_local_ip_addresses() is called.
+LOCAL_IP_ADDRESSES_TTL = 300
+
+# Max number of parsed urls to be cached.
+# Parsing same url again returns cached results(see urlparse()).
+URL_PARSE_CACHE_SIZE = 1024
+
+
 # url parsing functions
-def urlparse(url):
+def _split_simple_url(url):
+    # Splits common url in single pass without parse.urlparse() into
+    # (scheme, netloc, path, query, fragment) which are same as parts
+    # parse.urlparse() returns e.g 'https://example.com/a?q=1' or
+    # relative path 'docs/file.txt'.
+    # Returns None for other urls(whitespace, control or non ascii
+    # characters, params, ipv6 host, etc) which need parse.urlparse().
+    if not url.isascii() or not url.isprintable() or " " in url \
+        or ";" in url:
+        return None
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        if ":" in url or url.startswith("//"):
+            return None
+        scheme, rest = "", url
+    elif not scheme.isalnum() or not scheme[0].isalpha():
+        return None
+    rest, _, fragment = rest.partition("#")
+    rest, _, query = rest.partition("?")
+    if separator:
+        netloc, slash, path = rest.partition("/")
+        if "[" in netloc or "]" in netloc:
+            return None
+        path = slash + path
+    else:
+        netloc, path = "", rest
+    return scheme.lower(), netloc, path, query, fragment
+
+def _parse_url(url):
+    # Same as parse.urlparse() but common urls are split faster.
+    if isinstance(url, str):
+        split = _split_simple_url(url)
+        if split is not None:
+            scheme, netloc, path, query, fragment = split
+            return parse.ParseResult(
+                scheme, netloc, path, "", query, fragment
+            )
     return parse.urlparse(url)
 
+def _create_parse_cache(max_size):
+    # Creates cached version of _parse_url() with max_size.
+    return functools.lru_cache(max_size)(_parse_url)
+
+_cached_urlparse = _create_parse_cache(URL_PARSE_CACHE_SIZE)
+
+def set_parse_cache_size(max_size):
+    # Sets max size of urls parse cache(existing results are discarded)
+    global _cached_urlparse
+    _cached_urlparse = _create_parse_cache(max_size)
+
+def parse_cache_info():
+    # Returns hits, misses, maxsize and currsize of urls parse cache
+    return _cached_urlparse.cache_info()
+
+def clear_parse_cache():
+    _cached_urlparse.cache_clear()
+
+def urlparse(url):
+    # Parses url into its components(results are cached).
+    # Results are immutable and shared by every caller.
+    try:
+        return _cached_urlparse(url)
+    except TypeError:
+        # url cannot be hashed so it cant be cached.
+        return _parse_url(url)
+
 def urlparse_dict(url):
     return urlparse(url)._asdict()
 
@@ -32,36 +107,36 @@ def urlparse_to_url(parse_results):
 # Functions for extracting parts of url
 def extract_path(url: str):
     # Extracts path part of url
-    return parse.urlparse(url).path
+    return urlparse(url).path
 
 def extract_hostname(url: str):
     # Extracts hostname part of url
-    return parse.urlparse(url).hostname
+    return urlparse(url).hostname
 
 def extract_netloc(url: str):
     # Extracts netloc part of url
-    return parse.urlparse(url).netloc
+    return urlparse(url).netloc
 
 def extract_scheme(url: str):
     # Extracts scheme of url
-    return parse.urlparse(url).scheme
+    return urlparse(url).scheme
 
 def extract_params(url: str):
     # Extracts parameter passed to url
-    return parse.urlparse(url).params
+    return urlparse(url).params
 
 def extract_query(url: str):
-    return parse.urlparse(url).query
+    return urlparse(url).query
 
 def extract_port(url: str):
-    port = parse.urlparse(url).port
+    port = urlparse(url).port
     if port == None:
         return ""
     else:
         return str(port)
 
 def extract_fragment(url: str):
-    return parse.urlparse(url).fragment
+    return urlparse(url).fragment
 
 
 # # Functions for validationg url
@@ -73,15 +148,21 @@ def extract_fragment(url: str):
 
 def is_url(_source, schemes=None):
     # Checks if source is url for web resource.
+    if isinstance(_source, bytes):
+        # bytes are decoded same as paths(see os.fsdecode()).
+        _source = os.fsdecode(_source)
+    if isinstance(_source, str) and _lacks_scheme(_source):
+        # Strings without scheme(e.g paths) are rejected without parsing.
+        if schemes == None or "" not in schemes:
+            return False
     if isinstance(_source, (str, bytes)):
-        scheme = extract_scheme(_source)
-        netloc = extract_netloc(_source)
-        path = extract_path(_source)
-        any_items = (netloc, path)
+        # url is parsed once and its parts reused.
+        parsed = urlparse(_source)
+        any_items = (parsed.netloc, parsed.path)
         if schemes != None:
-            return scheme in schemes and any(any_items)
+            return parsed.scheme in schemes and any(any_items)
         else:
-            return bool((scheme)) and any(any_items)
+            return bool((parsed.scheme)) and any(any_items)
     return False
 
 def resembles_scheme(_url, scheme):
@@ -110,33 +191,61 @@ def resembles_schemes(_url, schemes):
             return True
     return False
 
+def _scheme_resembled(url_scheme, schemes):
+    # Same as resembles_schemes() but for already extracted scheme.
+    for scheme in schemes:
+        if scheme != None:
+            if scheme == url_scheme:
+                return True
+        elif url_scheme:
+            return True
+    return False
+
+def _lacks_scheme(url):
+    # Checks if parse.urlparse() surely finds neither scheme nor netloc
+    # in url(e.g 'docs/file.txt') and wont raise error.
+    # Leading whitespace and tabs/newlines are removed when parsing
+    # which could turn '/\t/host' into '//host'.
+    return ":" not in url and url[:1] > " " and not url.startswith("//") \
+        and "\t" not in url and "\n" not in url and "\r" not in url
+
 def resembles_url(_source, schemes=None):
     # Checks if source resembles url.
     # 1. source should 2 of any of url parts excluding path and hostname.
     # 2. Or source should have scheme(or resemble) and path.
     # 2. Or source should have atleast hostname.
+    if isinstance(_source, bytes):
+        # bytes are decoded same as paths(see os.fsdecode()).
+        _source = os.fsdecode(_source)
+    if isinstance(_source, str) and schemes != None and \
+        _lacks_scheme(_source) and not _scheme_resembled("", schemes):
+        # Strings without scheme(e.g paths) are rejected without parsing.
+        return False
     if isinstance(_source, (str, bytes)):
+        # url is parsed once and its parts reused.
+        parsed = urlparse(_source)
         if schemes != None:
             # URL needs to have atleast one of provided schemes
-            scheme_satisfied = resembles_schemes(_source, schemes)
+            scheme_satisfied = _scheme_resembled(parsed.scheme, schemes)
         else:
             # Dont care if url has scheme if schemes not provided
             scheme_satisfied = True
 
-        if scheme_satisfied and resembles_hostname(_source, None):
+        if scheme_satisfied and parsed.hostname:
             # Hostname is enough to satify url
             return True
-        elif scheme_satisfied and extract_path(_source):
+        elif scheme_satisfied and parsed.path:
             # scheme and path satisfies url
             return True
         else:
             # source satifying scheme and atleast 2 other parts of url
             # can be considered resembling url.
+            port = parsed.port
             any_items = [
-                extract_query(_source),
-                extract_params(_source),
-                extract_port(_source),
-                extract_fragment(_source)
+                parsed.query,
+                parsed.params,
+                "" if port == None else str(port),
+                parsed.fragment
             ]
             any_items_filtered = list(filter(None, any_items))
             return scheme_satisfied and len(any_items_filtered) >= 2
@@ -147,32 +256,30 @@ def resembles_url(_source, schemes=None):
 def make_url_absolute(base_url, url):
     # Makes url absolute by adding missing parts from base_url
     # inspired by: requests-html requests_html.BaseParse._make_absolute()
+    # bytes urls are decoded(see os.fsdecode()) and result is encoded
+    # back to bytes if url is bytes.
+    if isinstance(url, bytes):
+        return os.fsencode(
+            make_url_absolute(os.fsdecode(base_url), os.fsdecode(url))
+        )
+    base_url = os.fsdecode(base_url)
 
     # Parse url componets into dictionary
     parsed = urlparse(url)._asdict()
 
-    # Setup slashes to be used
-    if isinstance(url, str):
-        single_slash = "/"
-        double_slash = "//"
-    else:
-        single_slash = b"/"
-        double_slash = b"//"
-
     # url almost complete but missing scheme
-    if url.startswith(double_slash):
+    if url.startswith("//"):
         parsed['scheme'] = urlparse(base_url).scheme
-        
 
         # Recreates url with new scheme and netloc
         parsed = [value for value in parsed.values()]
         return url_unparse(parsed)
 
     # Link is absolute; its just missing scheme and netloc
-    elif url.startswith(single_slash):
-        print(parsed, url, single_slash)
-        parsed['scheme'] = urlparse(base_url).scheme
-        parsed['netloc'] = urlparse(base_url).netloc
+    elif url.startswith("/"):
+        parsed_base = urlparse(base_url)
+        parsed['scheme'] = parsed_base.scheme
+        parsed['netloc'] = parsed_base.netloc
 
         # Recreates url with new scheme
         parsed = [value for value in parsed.values()]
@@ -194,6 +301,7 @@ def make_url_absolute(base_url, url):
 # Functions relating to IP addresses
 def _get_local_adress():
     # Gets ip adress of local machine
+    import socket
     hostname = socket.gethostname()
     return socket.gethostbyname(hostname)
 
@@ -201,15 +309,50 @@ def _get_local_ip_adresses():
     # Gets ip adresses of local machine.
     # Functions is not reliable and shouldnt be depended.
     # source: https://stackoverflow.com/questions/270745/
+    import socket
     addreses = set()
     for info in socket.getaddrinfo(socket.gethostname(), None):
         addreses.add(info[4][0])
     return addreses
 
+# Cached ip addresses of local machine and time they were retrieved.
+_local_ip_addresses = None
+_local_ip_addresses_time = 0
+_local_ip_addresses_lock = threading.Lock()
+
+def get_local_ip_addresses(refresh=False):
+    # Gets ip adresses of local machine(results are cached).
+    # Addresses are retrieved again after LOCAL_IP_ADDRESSES_TTL.
+    global _local_ip_addresses, _local_ip_addresses_time
+    with _local_ip_addresses_lock:
+        ttl = LOCAL_IP_ADDRESSES_TTL
+        expired = ttl is not None and \
+            time.monotonic() - _local_ip_addresses_time > ttl
+        if refresh or expired or _local_ip_addresses is None:
+            _local_ip_addresses = frozenset(_get_local_ip_adresses())
+            _local_ip_addresses_time = time.monotonic()
+        return _local_ip_addresses
+
+def refresh_local_ip_addresses():
+    # Retrieves ip addresses of local machine again e.g network changed
+    return get_local_ip_addresses(refresh=True)
+
 def is_local_ip_address(ip_address):
     # Checks if url is built on local ip address.
+    # Loopback, link-local and unspecified addresses are always local.
     # Not reliable function.
-    return ip_address in _get_local_ip_adresses()
+    if not isinstance(ip_address, str):
+        return False
+    import ipaddress
+    try:
+        address = ipaddress.ip_address(ip_address)
+    except ValueError:
+        # Hostname is not ip address so it cant be local ip address.
+        return False
+    if address.is_loopback or address.is_link_local or \
+        address.is_unspecified:
+        return True
+    return str(address) in get_local_ip_addresses()
 
 
 # Functions for checking if url is hosted locally or remotely
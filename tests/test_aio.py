@@ -0,0 +1,52 @@
+# Tests of asynchronous high level functions(see resid.aio).
+
+import io
+import asyncio
+from concurrent import futures
+
+import pytest
+
+from resid import aio
+from resid import document
+
+
+class RecordingExecutor(futures.ThreadPoolExecutor):
+    # Executor counting calls submitted to it.
+    def __init__(self):
+        super().__init__(1)
+        self.count = 0
+
+    def submit(self, *args, **kwargs):
+        self.count += 1
+        return super().submit(*args, **kwargs)
+
+@pytest.fixture
+def executor():
+    previous = aio.get_executor()
+    executor = RecordingExecutor()
+    aio.set_executor(executor)
+    yield executor
+    aio.set_executor(previous)
+    executor.shutdown()
+
+@pytest.fixture
+def sniffing():
+    document.FileMemory.sniff_size = 512
+    yield
+    del document.FileMemory.sniff_size
+
+
+def test_paths_are_offloaded(executor):
+    asyncio.run(aio.find_resource("setup.py"))
+    assert executor.count == 1
+
+def test_real_files_are_offloaded_when_sniffed(executor, sniffing, tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"%PDF-1.7\n")
+    with open(str(path), "rb") as file:
+        assert asyncio.run(aio.guess_content_type(file)) == "application/pdf"
+    assert executor.count == 1
+
+def test_memory_files_are_inline(executor, sniffing):
+    asyncio.run(aio.find_resource(io.BytesIO(b"%PDF-1.7\n")))
+    assert executor.count == 0
@@ -0,0 +1,41 @@
+# Tests of classifying many sources at once(see resid.batch).
+
+from concurrent import futures
+
+from resid import batch
+from resid import codes
+from resid import resource
+
+
+def create_info(content_type):
+    return resource.ResourceInfo(
+        uri="file.txt", uri_type="file-path", content_type=content_type,
+        encoding=None, supported=True, resembles=True, locally=True,
+        status="OK"
+    )
+
+
+def test_columns_hold_many_distinct_values():
+    columns = batch.ResultColumns()
+    start = len(codes.content_types)
+    for index in range(70000 - start):
+        columns.append(create_info("type/{}".format(index)))
+    assert len(codes.content_types) >= 70000
+    assert columns.get_value("content_type", len(columns) - 1) == \
+        "type/{}".format(69999 - start)
+
+def test_sources_repeated_across_chunks_are_shipped_once(monkeypatch):
+    shipped = []
+    submit = futures.ProcessPoolExecutor.submit
+    def recording_submit(self, function, sources, *args):
+        shipped.extend(sources)
+        return submit(self, function, sources, *args)
+    monkeypatch.setattr(futures.ProcessPoolExecutor, "submit",
+        recording_submit)
+
+    sources = ["a.txt", "https://example.com/", "b.txt"] * 20
+    results = list(batch.classify_many(sources, processes=2, chunk_size=3))
+    expected = list(batch.classify_many(sources, records=True))
+    assert sorted(shipped) == sorted(set(sources))
+    assert [info.uri_type for info in results] == \
+        [info.uri_type for info in expected]
@@ -0,0 +1,41 @@
+# Tests of command line interface(see resid.cli).
+# CLI is run in subprocess as 'python -m resid' with utf-8 stdio.
+
+import os
+import sys
+import json
+import subprocess
+
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    os.pardir, "source")
+
+# Raw file system name that is not valid utf-8.
+RAW_NAME = b"caf\xe9.txt"
+
+
+def run_cli(args, stdin=b""):
+    # Returns stdout(bytes) of CLI run with args.
+    env = dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONPATH=SOURCE_DIR)
+    process = subprocess.run(
+        [sys.executable, "-m", "resid", "-q"] + args, input=stdin,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, check=True
+    )
+    return process.stdout
+
+def test_tsv_round_trips_raw_names_from_stdin():
+    output = run_cli(["--format", "tsv", "--fields", "source"],
+        RAW_NAME + b"\n")
+    assert output == RAW_NAME + b"\n"
+
+def test_tsv_round_trips_raw_names_from_file(tmp_path):
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_bytes(RAW_NAME + b"\nhttp://example.com\n")
+    output = run_cli([str(manifest), "--format", "tsv", "--fields", "source"])
+    assert output == RAW_NAME + b"\nhttp://example.com\n"
+
+def test_jsonl_keeps_raw_names_as_surrogates():
+    output = run_cli(["--fields", "source", "uri_type"], RAW_NAME + b"\n")
+    record = json.loads(output.decode("utf-8"))
+    assert record["source"].encode("utf-8", "surrogateescape") == RAW_NAME
+    assert record["uri_type"] == "file-path"
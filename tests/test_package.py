@@ -0,0 +1,40 @@
+# Tests of lazy imports of resid package(see resid/__init__.py).
+
+import os
+import sys
+import importlib
+import subprocess
+
+import resid
+
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    os.pardir, "source")
+
+
+def get_imported_modules(code):
+    # Returns resid modules imported after running code in new process.
+    code = "import sys; {}; print('\\n'.join(sys.modules))".format(code)
+    env = dict(os.environ, PYTHONPATH=SOURCE_DIR)
+    output = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, env=env,
+        universal_newlines=True, check=True
+    ).stdout
+    return {name for name in output.split() if name.startswith("resid.")}
+
+
+def test_exports_match_modules():
+    for module_name in set(resid._EXPORTS.values()):
+        module = importlib.import_module("resid." + module_name)
+        exported = [name for name, exporting_module in \
+            resid._EXPORTS.items() if exporting_module == module_name]
+        assert exported == module.__all__
+
+def test_exported_name_imports_only_its_module():
+    imported = get_imported_modules("import resid; resid.guess_content_type")
+    assert "resid.highlevel" in imported
+    assert "resid.batch" not in imported
+    assert "resid.instrumentation" not in imported
+
+def test_import_is_lazy():
+    assert get_imported_modules("import resid") == set()
@@ -0,0 +1,58 @@
+# Tests of guessing content type from contents(see resid.sniff).
+
+import os
+
+import pytest
+
+from resid import sniff
+from resid import document
+from resid import filepath
+
+
+SQLITE_HEAD = b"SQLite format 3\x00"
+
+
+@pytest.fixture
+def builtin_types():
+    # Types table without system types(.sqlite and others are unknown).
+    filepath.refresh_types_table(False)
+    yield
+    filepath.refresh_types_table()
+
+class SniffedFilePath(document.FilePath):
+    sniff_size = sniff.DEFAULT_SNIFF_SIZE
+
+
+def test_sniff_type():
+    assert sniff.sniff_type(b"%PDF-1.7\n") == ("application/pdf", None)
+    assert sniff.sniff_type(b"\x1f\x8b\x08") == (None, "gzip")
+    assert sniff.sniff_type(b"no signature") is None
+
+def test_unknown_sniffed_type_is_none(builtin_types):
+    assert filepath.guess_type("db.sqlite") == (None, None)
+    assert sniff.sniff_type(SQLITE_HEAD) is None
+    assert sniff.choose_type(None, ".sqlite") is None
+
+def test_unknown_sniffed_type_keeps_name_type(builtin_types, tmp_path):
+    path = tmp_path / "db.bin"
+    path.write_bytes(SQLITE_HEAD)
+    resource = SniffedFilePath(str(path))
+    assert resource.sniffed_type is None
+    assert resource.content_type == "application/octet-stream"
+
+def test_sniff_file_does_not_wait_for_pipe():
+    # Nothing was written to pipe, reading it would block.
+    read_fd, write_fd = os.pipe()
+    try:
+        with os.fdopen(read_fd, "rb") as file:
+            assert sniff.sniff_file(file) is None
+    finally:
+        os.close(write_fd)
+
+def test_sniff_file_keeps_position(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"%PDF-1.7\n")
+    with open(str(path), "rb") as file:
+        file.read(3)
+        assert sniff.sniff_file(file) == ".pdf"
+        assert file.tell() == 3
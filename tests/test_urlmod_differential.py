@@ -0,0 +1,135 @@
+# Differential tests of fast url parsing in urlmod.
+# urlmod.urlparse() splits common urls without parse.urlparse() and
+# urlmod.is_url() and urlmod.resembles_url() reject strings without
+# scheme without parsing them. Their results(and errors) are compared
+# against parse.urlparse() and reference versions always using it on
+# benchmark corpus and random strings.
+# benchmarks/check_urls.py runs same comparison on more strings.
+
+import random
+import tempfile
+from urllib import parse
+
+import pytest
+
+from resid import urlmod
+from resid import weburl
+
+import corpus
+
+
+SCHEMES = (None, weburl.WEB_URL_SCHEMES, {"file"}, {""}, {None, "http"}, ())
+
+# Pieces random strings are made of, including ones parse.urlparse()
+# treats specially.
+PIECES = (
+    "http", "HTTPS", "file", "ftp", "a+b.c-d", "1x", "C", ":", "://", "//",
+    "/", "\\", "?", "#", ";", "@", "[", "]", "[::1]", "%", "%25", ".", "..",
+    "example.com", "localhost", ":8080", ":0", ":65536", ":abc", ":+1",
+    ":", " ", "\t", "\n", "\r", "\x00", "\x1f", "\x7f", "é", "＃",
+    "℀", "a", "b", "1", "=", "&", "docs", "file.txt"
+)
+
+
+def reference_is_url(_source, schemes=None):
+    if isinstance(_source, (str, bytes)):
+        parsed = parse.urlparse(_source)
+        any_items = (parsed.netloc, parsed.path)
+        if schemes != None:
+            return parsed.scheme in schemes and any(any_items)
+        else:
+            return bool((parsed.scheme)) and any(any_items)
+    return False
+
+def reference_resembles_url(_source, schemes=None):
+    if isinstance(_source, (str, bytes)):
+        parsed = parse.urlparse
+        if schemes != None:
+            scheme_satisfied = False
+            for scheme in schemes:
+                url_scheme = parsed(_source).scheme
+                if scheme != None:
+                    scheme_satisfied = scheme == url_scheme
+                else:
+                    scheme_satisfied = bool(url_scheme)
+                if scheme_satisfied:
+                    break
+        else:
+            scheme_satisfied = True
+        if scheme_satisfied and parsed(_source).hostname:
+            return True
+        elif scheme_satisfied and parsed(_source).path:
+            return True
+        port = parsed(_source).port
+        any_items = [
+            parsed(_source).query,
+            parsed(_source).params,
+            "" if port == None else str(port),
+            parsed(_source).fragment
+        ]
+        return scheme_satisfied and len(list(filter(None, any_items))) >= 2
+    return False
+
+
+def create_strings(count, rng):
+    # Creates random strings made of PIECES.
+    return ["".join(rng.choice(PIECES) for _ in range(rng.randint(0, 8))) \
+        for _ in range(count)]
+
+def create_sources(count, seed=0):
+    # Returns string sources of benchmark corpus and random strings.
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as root:
+        corpus_obj = corpus.Corpus(root, 1000, seed)
+        sources = [source for source in corpus_obj.get("mixed") \
+            if isinstance(source, str)]
+    return sources + create_strings(count, rng)
+
+def call(function, *args):
+    # Returns result of function or type of error it raised.
+    try:
+        return function(*args)
+    except Exception as error:
+        return type(error)
+
+def urlparse_differences(sources):
+    # Yields descriptions of sources parsed differently.
+    for source in sources:
+        result = call(urlmod.urlparse, source)
+        expected = call(parse.urlparse, source)
+        if result != expected or type(result) != type(expected):
+            yield "urlparse({!r}): {!r} != {!r}".format(
+                source, result, expected)
+
+def function_differences(function, reference, sources):
+    # Yields descriptions of sources function classifies differently.
+    for source in sources:
+        for schemes in SCHEMES:
+            result = call(function, source, schemes)
+            expected = call(reference, source, schemes)
+            if result != expected:
+                yield "{}({!r}, {!r}): {!r} != {!r}".format(
+                    function.__name__, source, schemes, result, expected)
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return create_sources(5000)
+
+def assert_no_differences(differences):
+    differences = list(differences)
+    assert not differences, "{} difference(s):\n{}".format(
+        len(differences), "\n".join(differences[:20]))
+
+def test_urlparse(sources):
+    assert_no_differences(urlparse_differences(sources))
+
+def test_is_url(sources):
+    assert_no_differences(
+        function_differences(urlmod.is_url, reference_is_url, sources)
+    )
+
+def test_resembles_url(sources):
+    assert_no_differences(function_differences(
+        urlmod.resembles_url, reference_resembles_url, sources
+    ))